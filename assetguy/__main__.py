@@ -0,0 +1,6 @@
+"""Allow running the CLI with ``python -m assetguy``."""
+
+from assetguy.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,32 @@
-"""Asset classes for different media types."""
+"""Asset classes for different media types.
 
-from .base import Asset
-from .gif import GifAsset
-from .image import ImageAsset
-from .video import VideoAsset
+Names are resolved lazily on first access, so importing one asset module
+(e.g. ``assetguy.assets.gif``) does not import Pillow for the others.
+"""
 
-__all__ = ['Asset', 'GifAsset', 'ImageAsset', 'VideoAsset']
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'Asset': 'base',
+    'AssetNotFoundError': 'base',
+    'GifAsset': 'gif',
+    'ImageAsset': 'image',
+    'VideoAsset': 'video',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
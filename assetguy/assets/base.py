@@ -1,8 +1,28 @@
 """Base asset class."""
 
+import errno
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Iterable, List, Mapping, Optional
+
+
+# Shared worker pool for metadata extraction. Threads are enough because the
+# work is subprocess waits, file I/O and PIL C code, all of which release the
+# GIL; the pool is reused so repeated bulk calls pay no startup cost.
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+class AssetNotFoundError(FileNotFoundError):
+    """Raised when an asset file does not exist.
+    
+    Distinguishes a missing input file from other FileNotFoundErrors, such as
+    a missing external tool.
+    """
+    
+    def __init__(self, path):
+        super().__init__(errno.ENOENT, "Asset not found", str(path))
 
 
 class Asset(ABC):
@@ -15,24 +35,56 @@ class Asset(ABC):
             path: Path to the asset file
         """
         self.path = Path(path)
-        if not self.path.exists():
-            raise FileNotFoundError(f"Asset not found: {path}")
+        # One stat up front serves both the existence check and size_bytes
+        try:
+            self._stat = self.path.stat()
+        except FileNotFoundError:
+            raise AssetNotFoundError(path)
     
     @abstractmethod
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> Mapping[str, Any]:
         """Get asset information.
         
         Returns:
-            Dictionary containing asset metadata
+            Read-only mapping containing asset metadata
         """
         pass
     
+    @classmethod
+    def bulk_info(cls, assets: Iterable['Asset']) -> List[Mapping[str, Any]]:
+        """Get information for many assets concurrently.
+        
+        Args:
+            assets: Assets to inspect
+        
+        Returns:
+            List of get_info() results, in the same order as the input
+        """
+        return list(_POOL.map(lambda asset: asset.get_info(), assets))
+    
     @property
     def exists(self) -> bool:
         """Check if asset file exists."""
         return self.path.exists()
     
+    @property
+    def stat(self) -> os.stat_result:
+        """Get the file's stat information (as of construction or the last refresh_stat())."""
+        return self._stat
+    
     @property
     def size_bytes(self) -> int:
-        """Get file size in bytes."""
-        return self.path.stat().st_size if self.path.exists() else 0
+        """Get file size in bytes (as of construction or the last refresh_stat())."""
+        return self._stat.st_size
+    
+    def refresh_stat(self) -> os.stat_result:
+        """Re-read the file's stat information.
+        
+        Returns:
+            Fresh stat result for the asset file
+        
+        Raises:
+            FileNotFoundError: If the file no longer exists
+        """
+        self._stat = self.path.stat()
+        return self._stat
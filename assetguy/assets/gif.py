@@ -1,15 +1,104 @@
 """GIF asset class."""
 
+import bisect
+import os
 import subprocess
+from array import array
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Any, Iterable, Mapping, Optional, Tuple, List
 
-from .base import Asset
+from .base import Asset, AssetNotFoundError
 from ..tools.detector import get_imagemagick_command
 from ..tools.executor import run
+from ..utils.cache import get_meta_cache
 from ..utils.formatting import filesize_mb
 
 
+# Static identify arguments. Every line is prefixed with the input filename (%i)
+# so the output of a multi-file identify can be grouped back per file.
+_IDENTIFY_HEADER_ARGS = ("identify", "-ping", "-format", "%i|%w %h %k\n")
+_IDENTIFY_DELAYS_ARGS = ("identify", "-ping", "-format", "%i|%T\n")
+
+
+# File signatures of the two GIF versions
+_GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+
+
+def _scan_gif_blocks(f: BinaryIO) -> Optional[Tuple[int, int, List[int]]]:
+    """Walk the block structure of a GIF without decoding any image data.
+    
+    Color tables and image data sub-blocks are seeked over by their lengths;
+    only the logical screen descriptor, the block headers and the graphic
+    control extensions are read, so neither the whole file nor any pixel
+    data is loaded.
+    
+    Args:
+        f: GIF file opened in binary mode, positioned at its start
+    
+    Returns:
+        Tuple (width, height, per-frame delays in centiseconds), or None if
+        the file is not a complete, well-formed GIF
+    """
+    read = f.read
+    header = read(13)
+    if len(header) < 13 or header[:6] not in _GIF_SIGNATURES:
+        return None
+    
+    width = header[6] | (header[7] << 8)
+    height = header[8] | (header[9] << 8)
+    flags = header[10]
+    if flags & 0x80:
+        # Global color table: 3 bytes per entry, 2^(N+1) entries
+        f.seek(3 << ((flags & 7) + 1), os.SEEK_CUR)
+    
+    delays: List[int] = []
+    delay = 0
+    while True:
+        block = read(1)
+        if block == b"\x3b":  # Trailer
+            break
+        elif block == b"\x21":  # Extension
+            if read(1) == b"\xf9":
+                # Graphic control extension: delay of the next image. Its
+                # data sub-block is consumed here, the terminator below.
+                size = read(1)
+                if not size:
+                    return None
+                gce = read(size[0])
+                if len(gce) < size[0]:
+                    return None
+                if size[0] >= 4:
+                    delay = gce[1] | (gce[2] << 8)
+        elif block == b"\x2c":  # Image descriptor
+            descriptor = read(9)
+            if len(descriptor) < 9:
+                return None
+            flags = descriptor[8]
+            # Local color table, if any, then the LZW minimum code size
+            f.seek((3 << ((flags & 7) + 1) if flags & 0x80 else 0) + 1, os.SEEK_CUR)
+            delays.append(delay)
+            delay = 0
+        else:
+            # Unknown block, or end of file before the trailer (truncated);
+            # leave it to the ImageMagick fallback
+            return None
+        
+        # Skip the data sub-blocks up to the zero-length terminator
+        while True:
+            size = read(1)
+            if not size:
+                return None
+            if size == b"\x00":
+                break
+            f.seek(size[0], os.SEEK_CUR)
+    
+    if not delays:
+        return None
+    return width, height, delays
+
+
 class GifAsset(Asset):
     """GIF asset with metadata and manipulation capabilities."""
     
@@ -20,64 +109,290 @@ class GifAsset(Asset):
             path: Path to GIF file
         """
         super().__init__(path)
-        self._info: Optional[Dict[str, Any]] = None
+        self._info: Optional[Mapping[str, Any]] = None
+        # Cumulative delays in centiseconds, built lazily by _cumulative_delays()
+        self._cum_cs: Optional[List[int]] = None
+    
+    @staticmethod
+    def has_signature(path: Path) -> bool:
+        """Check whether a file starts with a GIF signature (GIF87a/GIF89a).
+        
+        Reads only the first 6 bytes, so it is a cheap check before any
+        metadata extraction.
+        
+        Args:
+            path: Path to the file
+        
+        Returns:
+            True if the file has a GIF signature, False otherwise
+        
+        Raises:
+            AssetNotFoundError: If the file does not exist
+        """
+        try:
+            with open(path, 'rb') as f:
+                return f.read(6) in _GIF_SIGNATURES
+        except FileNotFoundError:
+            raise AssetNotFoundError(path)
     
-    def get_info(self) -> Dict[str, Any]:
-        """Extract GIF information using ImageMagick identify command.
+    def get_info(self) -> Mapping[str, Any]:
+        """Extract GIF information using Pillow, falling back to ImageMagick identify.
+        
+        The result is a read-only view shared across calls (delays are a tuple),
+        so no copy is made on the cached path.
         
         Returns:
-            Dictionary containing GIF metadata, or None if extraction fails
+            Read-only mapping containing GIF metadata, or None if extraction fails
         """
         if self._info is not None:
-            return self._info.copy()
+            return self._info
+        
+        info = self.bulk_get_info([self.path]).get(self.path)
+        if info is None:
+            return None
+        
+        info['delays'] = tuple(info['delays'])
+        self._info = MappingProxyType(info)
+        # Cumulative delays belong to the previous info, if any
+        self._cum_cs = None
+        return self._info
+    
+    def _cumulative_delays(self) -> List[int]:
+        """Get cumulative frame delays, computed once per loaded info.
+        
+        Returns:
+            List where item i is the start time of frame i in centiseconds and
+            the last item is the total duration (empty if info is unavailable)
+        """
+        if self._cum_cs is None:
+            info = self.get_info()
+            if not info:
+                return []
+            self._cum_cs = [0] + list(accumulate(info['delays']))
+        return self._cum_cs
+    
+    @classmethod
+    def bulk_get_info(cls, paths: List[Path]) -> Dict[Path, Optional[Dict[str, Any]]]:
+        """Extract GIF information for many files with batched identify calls.
+        
+        Cached entries are served from the metadata cache and the rest are read
+        in-process with Pillow; any files Pillow cannot read are passed to
+        ImageMagick (one call for first-frame dimensions, one for delays) and
+        the output is split per file.
+        
+        Args:
+            paths: List of paths to GIF files
+        
+        Returns:
+            Dictionary mapping each path to its GIF metadata (None if extraction failed)
+        """
+        paths = [Path(p) for p in paths]
+        results: Dict[Path, Optional[Dict[str, Any]]] = {}
+        
+        cache = get_meta_cache()
+        missing = []
+        for path in paths:
+            info = cache.get(path, 'gif')
+            if info is None:
+                # Read in-process with Pillow; only files it cannot handle
+                # are passed on to ImageMagick
+                info = cls._read_with_pil(path)
+                if info is not None:
+                    cache.put(path, 'gif', info)
+            results[path] = info
+            if info is None:
+                missing.append(path)
+        
+        if not missing:
+            return results
         
         magick_cmd = get_imagemagick_command()
         if not magick_cmd:
+            return results
+        
+        # Dimensions and colors come from the first frame only ([0]), which
+        # keeps that call O(1) in the number of frames; delays need every frame
+        headers, header_rc = cls._identify_by_file(
+            magick_cmd, _IDENTIFY_HEADER_ARGS, [f"{path}[0]" for path in missing]
+        )
+        delay_lines, delays_rc = cls._identify_by_file(
+            magick_cmd, _IDENTIFY_DELAYS_ARGS, [str(path) for path in missing]
+        )
+        
+        for path in missing:
+            header = cls._lookup_by_file(headers, path)
+            lines = cls._lookup_by_file(delay_lines, path)
+            info = cls._parse_identify_lines(header[0], lines) if header and lines else None
+            results[path] = info
+            if info is not None and header_rc == 0 and delays_rc == 0:
+                cache.put(path, 'gif', info)
+        
+        return results
+    
+    @classmethod
+    def columnar(cls, assets: Iterable['GifAsset']) -> Dict[str, array]:
+        """Collect metadata for many GIFs as one typed array per field.
+        
+        Suited to bulk filtering and aggregation, e.g. summing durations or
+        selecting GIFs longer than a threshold, without walking one dict per
+        asset. GIFs whose metadata cannot be read are left out; the 'index'
+        column maps each row back to its position in the input.
+        
+        Args:
+            assets: GIF assets to collect
+        
+        Returns:
+            Dictionary mapping 'index', 'width', 'height', 'frames', 'colors',
+            'duration' and 'fps' to arrays of equal length
+        """
+        assets = list(assets)
+        infos = cls.bulk_get_info([asset.path for asset in assets])
+        
+        columns = {
+            'index': array('l'),
+            'width': array('l'),
+            'height': array('l'),
+            'frames': array('l'),
+            'colors': array('l'),
+            'duration': array('d'),
+            'fps': array('d'),
+        }
+        for index, asset in enumerate(assets):
+            info = infos.get(asset.path)
+            if info is None:
+                continue
+            columns['index'].append(index)
+            for field in ('width', 'height', 'frames', 'colors', 'duration', 'fps'):
+                columns[field].append(info[field])
+        
+        return columns
+    
+    @staticmethod
+    def _identify_by_file(magick_cmd: str, identify_args: Tuple[str, ...], files: List[str]) -> Tuple[Dict[str, List[str]], int]:
+        """Run one identify over several files and group its output per file.
+        
+        Args:
+            magick_cmd: ImageMagick command
+            identify_args: Static identify arguments (_IDENTIFY_HEADER_ARGS or _IDENTIFY_DELAYS_ARGS)
+            files: Input file arguments
+        
+        Returns:
+            Tuple (lines grouped by reported filename, identify return code)
+        """
+        lines_by_name: Dict[str, List[str]] = {}
+        
+        # Stream the output so parsing overlaps with identify and the full
+        # output is never held in memory as one string
+        with subprocess.Popen(
+            (magick_cmd, *identify_args, *files),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ) as process:
+            for line in process.stdout:
+                name, sep, fields = line.rstrip('\n').rpartition('|')
+                if sep:
+                    lines_by_name.setdefault(name, []).append(fields)
+        
+        return lines_by_name, process.returncode
+    
+    @staticmethod
+    def _lookup_by_file(lines_by_name: Dict[str, List[str]], path: Path) -> Optional[List[str]]:
+        """Find the identify output lines reported for a file.
+        
+        Args:
+            lines_by_name: Output of _identify_by_file()
+            path: Path to GIF file
+        
+        Returns:
+            Output lines for the file, or None if it was not reported
+        """
+        # Depending on the ImageMagick build, %i may include the [0] frame
+        # selector or report only the base filename
+        for name in (str(path), f"{path}[0]", path.name):
+            if name in lines_by_name:
+                return lines_by_name[name]
+        return None
+    
+    @staticmethod
+    def _read_with_pil(path: Path) -> Optional[Dict[str, Any]]:
+        """Extract GIF information in-process.
+        
+        Frame metadata is read by walking the GIF block headers; Pillow only
+        decodes the first frame, for the color count.
+        
+        Args:
+            path: Path to GIF file
+        
+        Returns:
+            Dictionary containing GIF metadata, or None if the file cannot be read
+        """
+        try:
+            from PIL import Image
+        except ImportError:
             return None
         
         try:
-            # Get basic info: dimensions, colors, delay
-            result = subprocess.run(
-                [magick_cmd, "identify", "-format", "%w %h %k %T\n", str(self.path)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            lines = result.stdout.strip().split('\n')
-            if not lines or not lines[0]:
-                return None
-            
-            # Parse first frame for dimensions
-            first_line = lines[0].split()
+            with open(path, 'rb') as f:
+                # Size, frame count and delays come from the block headers;
+                # seeking through the frames with Pillow would decode every one
+                scanned = _scan_gif_blocks(f)
+                if scanned is None:
+                    return None
+                
+                # Pillow reads the same handle, from the start
+                f.seek(0)
+                with Image.open(f) as img:
+                    # Colors are taken from the first frame; see count_colors()
+                    first_colors = img.getcolors(256)
+                    colors = len(first_colors) if first_colors else 256
+        except Exception:
+            return None
+        
+        width, height, delays = scanned
+        frame_count = len(delays)
+        
+        avg_delay = sum(delays) / len(delays)
+        fps = round(100 / avg_delay, 2) if avg_delay > 0 else 0
+        total_duration = sum(delays) / 100.0
+        
+        return {
+            'width': width,
+            'height': height,
+            'colors': colors,
+            'frames': frame_count,
+            'fps': fps,
+            'avg_delay': avg_delay,
+            'duration': total_duration,
+            'delays': delays
+        }
+    
+    @staticmethod
+    def _parse_identify_lines(header: str, lines: List[str]) -> Optional[Dict[str, Any]]:
+        """Parse identify output for a single GIF.
+        
+        Args:
+            header: First-frame line ("%w %h %k")
+            lines: One delay line ("%T") per frame
+        
+        Returns:
+            Dictionary containing GIF metadata, or None if parsing fails
+        """
+        try:
+            # Parse first frame for dimensions and colors
+            first_line = header.split()
             width = int(first_line[0])
             height = int(first_line[1])
+            colors = int(first_line[2]) if len(first_line) >= 3 else 0
             
-            # Count frames
-            frame_count = len([line for line in lines if line.strip()])
-            
-            # Extract colors and delays from all frames
-            all_colors = []
-            delays = []
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        try:
-                            all_colors.append(int(parts[2]))  # %k (colors) is 3rd field
-                        except (ValueError, IndexError):
-                            pass
-                    if len(parts) >= 4:
-                        try:
-                            delays.append(int(parts[3]))  # %T (delay) is 4th field
-                        except (ValueError, IndexError):
-                            pass
+            # Tokenize once; blank lines yield no tokens and are not frames
+            tokens = [fields for fields in map(str.split, lines) if fields]
+            frame_count = len(tokens)
+            if frame_count == 0:
+                return None
             
-            # Use max colors across all frames
-            if all_colors:
-                colors = max(all_colors)
-            else:
-                colors = int(first_line[2]) if len(first_line) >= 3 else 0
+            # Extract delays from all frames, skipping malformed values
+            delays = [int(fields[0]) for fields in tokens if fields[0].lstrip('-').isdigit()]
             
             # Validate that delays count matches frame count
             if len(delays) != frame_count:
@@ -93,7 +408,7 @@ class GifAsset(Asset):
             # Calculate total duration in seconds (delays are in centiseconds)
             total_duration = sum(delays) / 100.0 if delays else 0
             
-            self._info = {
+            return {
                 'width': width,
                 'height': height,
                 'colors': colors,
@@ -103,9 +418,27 @@ class GifAsset(Asset):
                 'duration': total_duration,
                 'delays': delays
             }
-            
-            return self._info.copy()
-        except (subprocess.CalledProcessError, ValueError, IndexError):
+        except (ValueError, IndexError):
+            return None
+    
+    def count_colors(self) -> Optional[int]:
+        """Count the maximum number of unique colors used by any frame.
+        
+        get_info() reports colors for the first frame only; this decodes every
+        frame and is correspondingly slower.
+        
+        Returns:
+            Maximum unique color count across all frames, or None if the GIF cannot be read
+        """
+        from PIL import Image, ImageSequence
+        
+        try:
+            with Image.open(self.path) as img:
+                return max(
+                    len(frame.convert('RGB').getcolors(1 << 24))
+                    for frame in ImageSequence.Iterator(img)
+                )
+        except Exception:
             return None
     
     def time_range_to_frames(self, start_time: float, end_time: Optional[float]) -> Optional[Tuple[int, int]]:
@@ -135,30 +468,18 @@ class GifAsset(Asset):
         if start_time >= end_time:
             return None
         
-        # Calculate cumulative time for each frame
-        cumulative_times = []
-        cumulative = 0.0
-        for delay in delays:
-            cumulative += delay / 100.0
-            cumulative_times.append(cumulative)
-        
-        # Find start frame: first frame that overlaps with start_time
-        start_frame = 0
-        prev_time = 0.0
-        for i, cum_time in enumerate(cumulative_times):
-            if cum_time > start_time:
-                start_frame = i
-                break
-            prev_time = cum_time
-        
-        # Find end frame: last frame that overlaps with end_time
-        prev_time = 0.0
-        end_frame = len(delays) - 1
-        for i, cum_time in enumerate(cumulative_times):
-            if prev_time > end_time:
-                end_frame = max(0, i - 1)
-                break
-            prev_time = cum_time
+        # Binary search the cumulative delays (centiseconds); rounding absorbs
+        # float error such as 0.1 + 0.2 != 0.3
+        cum_cs = self._cumulative_delays()
+        last_frame = len(delays) - 1
+        start_cs = round(start_time * 100, 6)
+        end_cs = round(end_time * 100, 6)
+        
+        # Start frame: the frame playing at start_time
+        start_frame = min(max(bisect.bisect_right(cum_cs, start_cs) - 1, 0), last_frame)
+        
+        # End frame: the last frame that starts no later than end_time
+        end_frame = min(max(bisect.bisect_right(cum_cs, end_cs) - 1, 0), last_frame)
         
         if start_frame > end_frame:
             return None
@@ -190,8 +511,10 @@ class GifAsset(Asset):
         # Calculate scale factor
         scale_factor = original_avg_delay / target_delay
         
-        # Scale each delay proportionally
-        scaled_delays = [max(1, round(delay / scale_factor)) for delay in delays]
+        # Scale each distinct delay once; GIFs typically use only a handful of
+        # delay values, so long animations reduce to a table lookup per frame
+        scaled = {delay: max(1, round(delay / scale_factor)) for delay in set(delays)}
+        scaled_delays = [scaled[delay] for delay in delays]
         
         return scaled_delays
     
@@ -219,11 +542,12 @@ class GifAsset(Asset):
         if start_frame < 0 or end_frame >= total_frames or start_frame > end_frame:
             return None
         
-        # Calculate start time: sum of delays before start_frame
-        start_time = sum(delays[:start_frame]) / 100.0
+        # Start time: sum of delays before start_frame
+        cum_cs = self._cumulative_delays()
+        start_time = cum_cs[start_frame] / 100.0
         
-        # Calculate end time: sum of delays up to and including end_frame
-        end_time = sum(delays[:end_frame + 1]) / 100.0
+        # End time: sum of delays up to and including end_frame
+        end_time = cum_cs[end_frame + 1] / 100.0
         
         return (start_time, end_time)
     
@@ -246,21 +570,6 @@ class GifAsset(Asset):
         if not delays or total_frames == 0:
             return []
         
-        # Build array of frame start times
-        # frame_start_times[i] = time when frame i starts
-        frame_start_times = [0.0]  # Frame 0 starts at 0
-        cumulative = 0.0
-        
-        # Calculate start time for each subsequent frame
-        # Frame i starts after all previous frames' delays
-        for delay in delays[:-1]:  # All but last delay
-            cumulative += delay / 100.0
-            frame_start_times.append(cumulative)
-        
-        # Convert frame numbers to time points
-        time_points = []
-        for frame_num in frame_numbers:
-            if 0 <= frame_num < len(frame_start_times):
-                time_points.append(frame_start_times[frame_num])
-        
-        return time_points
\ No newline at end of file
+        # Frame i starts after all previous frames' delays (_cum_cs[i])
+        cum_cs = self._cumulative_delays()
+        return [cum_cs[frame_num] / 100.0 for frame_num in frame_numbers if 0 <= frame_num < len(delays)]
\ No newline at end of file
@@ -2,7 +2,8 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Any, FrozenSet, List, Mapping, Optional
 
 from PIL import Image
 from .base import Asset
@@ -12,7 +13,7 @@ class ImageAsset(Asset):
     """Static image asset with metadata and manipulation capabilities."""
     
     # Supported image formats
-    SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.tiff', '.tif'}
+    SUPPORTED_FORMATS: FrozenSet[str] = frozenset({'.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.tiff', '.tif'})
     
     def __init__(self, path: Path):
         """Initialize image asset.
@@ -21,7 +22,8 @@ class ImageAsset(Asset):
             path: Path to image file
         """
         super().__init__(path)
-        self._info: Optional[Dict[str, Any]] = None
+        self._suffix_lower = self.path.suffix.lower()
+        self._info: Optional[Mapping[str, Any]] = None
         self._is_animated_webp: Optional[bool] = None
     
     @classmethod
@@ -35,39 +37,46 @@ class ImageAsset(Asset):
             List of ImageAsset instances
         """
         images = []
-        directory_path = Path(directory)
+        exts = cls.SUPPORTED_FORMATS
         
-        for ext in cls.SUPPORTED_FORMATS:
-            images.extend(directory_path.rglob(f'*{ext}'))
-            images.extend(directory_path.rglob(f'*{ext.upper()}'))
+        # Single walk of the tree; suffixes are matched case-insensitively
+        for root, _, files in os.walk(directory):
+            for name in files:
+                dot = name.rfind('.')
+                if dot >= 0 and name[dot:].lower() in exts:
+                    images.append(Path(root) / name)
         
-        return [cls(img_path) for img_path in sorted(images)]
+        images.sort()
+        return [cls(img_path) for img_path in images]
     
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> Mapping[str, Any]:
         """Get image information.
         
         Returns:
-            Dictionary containing image metadata
+            Read-only mapping containing image metadata
         """
         if self._info is not None:
-            return self._info.copy()
+            return self._info
         
         try:
-            with Image.open(self.path) as img:
+            # Image.open only parses the header; nothing is decoded as long as
+            # the pixel data is never accessed
+            with open(self.path, 'rb') as fh:
+                img = Image.open(fh)
                 width, height = img.size
-                file_size = self.size_bytes
-                
-                self._info = {
-                    'width': width,
-                    'height': height,
-                    'file_size': file_size,
-                    'format': img.format,
-                    'mode': img.mode,
-                }
-                
-                return self._info.copy()
+                fmt, mode = img.format, img.mode
         except Exception as e:
             raise ValueError(f"Error reading image: {e}")
+        
+        self._info = MappingProxyType({
+            'width': width,
+            'height': height,
+            'file_size': self.size_bytes,
+            'format': fmt,
+            'mode': mode,
+        })
+        
+        return self._info
     
     def is_supported(self) -> bool:
         """Check if image format is supported.
@@ -75,7 +84,7 @@ class ImageAsset(Asset):
         Returns:
             True if format is supported
         """
-        return self.path.suffix.lower() in self.SUPPORTED_FORMATS
+        return self._suffix_lower in self.SUPPORTED_FORMATS
     
     def is_animated_webp(self) -> bool:
         """Check if WebP file is animated.
@@ -86,25 +95,25 @@ class ImageAsset(Asset):
         if self._is_animated_webp is not None:
             return self._is_animated_webp
         
-        if self.path.suffix.lower() != '.webp':
+        if self._suffix_lower != '.webp':
             self._is_animated_webp = False
             return False
         
+        # Animation is flagged in the VP8X extended header: "RIFF" <size> "WEBP"
+        # "VP8X" <chunk size> <flags>, with bit 1 of the flags byte set.
+        # Simple (VP8/VP8L) WebP files have no VP8X chunk and are never animated.
         try:
-            with Image.open(self.path) as img:
-                # PIL's Image object has is_animated attribute for WebP
-                if hasattr(img, 'is_animated'):
-                    self._is_animated_webp = img.is_animated
-                    return self._is_animated_webp
-                
-                # Fallback: try to seek to frame 1
-                try:
-                    img.seek(1)
-                    self._is_animated_webp = True
-                    return True
-                except EOFError:
-                    self._is_animated_webp = False
-                    return False
-        except Exception:
+            with open(self.path, 'rb') as f:
+                header = f.read(21)
+        except OSError:
             self._is_animated_webp = False
             return False
+        
+        self._is_animated_webp = (
+            len(header) >= 21
+            and header[0:4] == b'RIFF'
+            and header[8:12] == b'WEBP'
+            and header[12:16] == b'VP8X'
+            and bool(header[20] & 0x02)
+        )
+        return self._is_animated_webp
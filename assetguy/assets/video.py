@@ -3,10 +3,12 @@
 import json
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from .base import Asset
 from ..tools.detector import check_ffmpeg
+from ..utils.cache import get_meta_cache
 
 
 class VideoAsset(Asset):
@@ -19,17 +21,86 @@ class VideoAsset(Asset):
             path: Path to video file
         """
         super().__init__(path)
-        self._info: Optional[Dict[str, Any]] = None
+        self._info: Optional[Mapping[str, Any]] = None
     
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> Mapping[str, Any]:
         """Extract video information using ffprobe.
         
         Returns:
-            Dictionary containing video metadata, or None if extraction fails
+            Read-only mapping containing video metadata, or None if extraction fails
         """
         if self._info is not None:
-            return self._info.copy()
+            return self._info
+        
+        cache = get_meta_cache()
+        cached = cache.get(self.path, 'video', self._stat)
+        if cached is not None:
+            self._info = MappingProxyType(cached)
+            return self._info
+        
+        # Read in-process with PyAV when it is installed; otherwise spawn ffprobe
+        info = self._read_with_av()
+        if info is None:
+            info = self._read_with_ffprobe()
+        if info is None:
+            return None
+        
+        cache.put(self.path, 'video', info, self._stat)
+        self._info = MappingProxyType(info)
+        return self._info
+    
+    def _read_with_av(self) -> Optional[Dict[str, Any]]:
+        """Extract video information in-process using PyAV, if available.
+        
+        Returns:
+            Dictionary containing video metadata, or None if PyAV is not
+            installed or cannot read the file
+        """
+        try:
+            import av
+        except ImportError:
+            return None
         
+        try:
+            with av.open(str(self.path)) as container:
+                if not container.streams.video:
+                    return None
+                stream = container.streams.video[0]
+                
+                width = int(stream.codec_context.width or 0)
+                height = int(stream.codec_context.height or 0)
+                fps = float(stream.average_rate) if stream.average_rate else 0
+                
+                # Container duration is expressed in av.time_base units
+                duration = container.duration / av.time_base if container.duration else 0
+                
+                codec = stream.codec_context.name or "unknown"
+                bitrate = int(container.bit_rate or 0)
+                bitrate_kbps = bitrate / 1000 if bitrate > 0 else 0
+                
+                frame_count = int(stream.frames or 0)
+                if frame_count == 0 and fps > 0 and duration > 0:
+                    frame_count = int(fps * duration)
+        except Exception:
+            return None
+        
+        return {
+            'width': width,
+            'height': height,
+            'fps': fps,
+            'duration': duration,
+            'codec': codec,
+            'bitrate': bitrate,
+            'bitrate_kbps': bitrate_kbps,
+            'frame_count': frame_count,
+        }
+    
+    def _read_with_ffprobe(self) -> Optional[Dict[str, Any]]:
+        """Extract video information using ffprobe.
+        
+        Returns:
+            Dictionary containing video metadata, or None if extraction fails
+        """
         # Check if ffprobe is available
         ffmpeg_available, _ = check_ffmpeg()
         if not ffmpeg_available:
@@ -41,6 +112,7 @@ class VideoAsset(Asset):
                 [
                     "ffprobe",
                     "-v", "quiet",
+                    "-select_streams", "v:0",
                     "-print_format", "json",
                     "-show_format",
                     "-show_streams",
@@ -91,7 +163,7 @@ class VideoAsset(Asset):
             if frame_count == 0 and fps > 0 and duration > 0:
                 frame_count = int(fps * duration)
             
-            self._info = {
+            return {
                 'width': width,
                 'height': height,
                 'fps': fps,
@@ -101,7 +173,6 @@ class VideoAsset(Asset):
                 'bitrate_kbps': bitrate_kbps,
                 'frame_count': frame_count,
             }
-            
-            return self._info.copy()
-        except (subprocess.CalledProcessError, json.JSONDecodeError, ValueError, KeyError) as e:
+        except (subprocess.CalledProcessError, OSError, json.JSONDecodeError, ValueError, KeyError) as e:
+            # OSError covers ffprobe itself missing while ffmpeg is installed
             return None
@@ -0,0 +1,5 @@
+"""CLI subcommands, one module per top-level command.
+
+Modules are imported on demand by the CLI group in ``assetguy.cli``; each
+module defines a Click command (or group) named after the module.
+"""
@@ -0,0 +1,31 @@
+"""Check command."""
+
+import click
+
+
+@click.command()
+def check():
+    """Check availability of required external tools."""
+    from ..tools.detector import check_imagemagick, check_ffmpeg
+    
+    # Collect the report and write it once, like presets and config show
+    lines = ["Checking external dependencies...", ""]
+    
+    # Check ImageMagick
+    magick_available, magick_version = check_imagemagick()
+    if magick_available:
+        lines.append(f"✓ ImageMagick: {magick_version}")
+    else:
+        lines.append("✗ ImageMagick: Not found")
+        lines.append("  Required for GIF operations")
+        lines.append("  Install: brew install imagemagick (macOS) or sudo apt-get install imagemagick (Linux)")
+    
+    # Check FFmpeg
+    ffmpeg_available, ffmpeg_version = check_ffmpeg()
+    if ffmpeg_available:
+        lines.append(f"✓ FFmpeg: {ffmpeg_version}")
+    else:
+        lines.append("✗ FFmpeg: Not found (optional, for video operations)")
+    
+    lines.append("")
+    click.echo("\n".join(lines))
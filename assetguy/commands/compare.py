@@ -0,0 +1,29 @@
+"""Compare command."""
+
+import click
+
+
+@click.command()
+@click.argument("file1", type=str)
+@click.argument("file2", type=str)
+@click.option("--json", "as_json", is_flag=True, help="Output in JSON format")
+def compare(file1: str, file2: str, as_json: bool):
+    """Compare two asset files.
+    
+    FILE1: Path to first asset file
+    FILE2: Path to second asset file
+    """
+    from pathlib import Path
+    from ..operations.compare import compare_assets, print_comparison
+    from ..utils.paths import strip_quotes
+    
+    path1 = Path(strip_quotes(file1))
+    path2 = Path(strip_quotes(file2))
+    
+    comparison = compare_assets(path1, path2)
+    
+    if as_json:
+        from ..utils.formatting import write_json
+        write_json(comparison)
+    else:
+        print_comparison(comparison)
@@ -0,0 +1,79 @@
+"""Config command group."""
+
+import click
+import sys
+from typing import Optional
+
+
+@click.group()
+@click.option("--config-path", type=click.Path(dir_okay=False), help="Config file to use instead of ~/.assetguy/config.yaml")
+@click.pass_context
+def config(ctx: click.Context, config_path: Optional[str]):
+    """Manage configuration settings."""
+    ctx.obj["config_path"] = config_path
+
+
+def _get_manager(ctx: click.Context):
+    """Get the ConfigManager memoized on the context object (see cli())."""
+    from ..config.manager import ConfigManager
+    
+    if "config" not in ctx.obj:
+        ctx.obj["config"] = ConfigManager(ctx.obj.get("config_path"))
+    return ctx.obj["config"]
+
+
+@config.command()
+@click.pass_context
+def show(ctx: click.Context):
+    """Show current configuration."""
+    config = _get_manager(ctx)
+    settings = config.get_config()
+    
+    # Build the whole listing as one string and write it once
+    body = "\n".join(f"  {key}: {value}" for key, value in settings.items())
+    click.echo(f"Current configuration:\n  Config file: {config.get_config_path()}\n\n{body}")
+
+
+@config.command()
+@click.argument("key")
+@click.argument("value")
+@click.pass_context
+def set(ctx: click.Context, key: str, value: str):
+    """Set a configuration value.
+    
+    KEY: Configuration key to set
+    VALUE: Value to set
+    """
+    config = _get_manager(ctx)
+    config.set(key, value)
+    click.echo(f"✓ Set {key} = {value}")
+
+
+@config.command()
+@click.argument("key")
+@click.pass_context
+def get(ctx: click.Context, key: str):
+    """Get a configuration value.
+    
+    KEY: Configuration key to get
+    """
+    config = _get_manager(ctx)
+    if key in config:
+        click.echo(f"{key}: {config[key]}")
+    else:
+        click.echo(f"Key '{key}' not found", err=True)
+        sys.exit(1)
+
+
+@config.command()
+@click.option("--yes", "-y", is_flag=True, help="Reset without asking for confirmation")
+@click.pass_context
+def reset(ctx: click.Context, yes: bool):
+    """Reset configuration to defaults."""
+    # Scripted callers pass --yes so no prompt (or TTY probing) happens
+    if not yes and not click.confirm("🔄 Are you sure you want to reset all settings to defaults?"):
+        click.echo("Reset cancelled")
+        return
+    
+    _get_manager(ctx).reset()
+    click.echo("✓ Configuration reset to defaults")
@@ -0,0 +1,203 @@
+"""Convert command."""
+
+import click
+import os
+import sys
+from typing import Optional
+
+
+@click.command()
+@click.argument("file_path", type=click.Path(exists=True))
+@click.option("--format", type=click.Choice(["gif", "webp"]), default="gif", help="Output format (gif or webp)")
+@click.option("--width", type=int, help="Target width in pixels")
+@click.option("--fps", type=float, help="Target FPS")
+@click.option("--colors", type=click.IntRange(4, 256), help="Number of colors 4-256 (for GIF)")
+@click.option("--quality", type=int, help="Quality 0-100 (for WebP)")
+@click.option("--start-time", type=float, help="Start time in seconds")
+@click.option("--end-time", type=float, help="End time in seconds")
+@click.option("--output", "-o", type=click.Path(), help="Output file path")
+@click.option("--overwrite", is_flag=True, help="Overwrite output file if it exists (non-interactive mode)")
+@click.option("--non-interactive", is_flag=True, help="Run in non-interactive mode")
+@click.option("--json", "as_json", is_flag=True, help="Output result in JSON format")
+def convert(file_path: str, format: str, width: Optional[int], fps: Optional[float], 
+            colors: Optional[int], quality: Optional[int], start_time: Optional[float], 
+            end_time: Optional[float], output: Optional[str], overwrite: bool, 
+            non_interactive: bool, as_json: bool):
+    """Convert a video file to GIF or WebP animation format.
+    
+    FILE_PATH: Path to the video file to convert
+    
+    The command will first inspect the video and display its information,
+    then prompt for conversion settings (format, width, FPS, colors/quality, time range).
+    """
+    from pathlib import Path
+    from ..operations.inspect import inspect_asset, print_inspection, detect_asset_type
+    from ..operations.convert import convert_video_to_gif, convert_video_to_webp, print_conversion_result
+    from ..assets.video import VideoAsset
+    from ..utils.paths import strip_quotes
+    from ..utils.prompts import ask_optional
+    
+    path = Path(strip_quotes(file_path))
+    
+    if not path.exists():
+        raise click.ClickException(f"File not found: {path}")
+    
+    # Detect asset type
+    asset_type = detect_asset_type(path)
+    if asset_type != 'video':
+        raise click.ClickException(f"Convert command only supports video files. Got: {asset_type}")
+    
+    # Check FFmpeg availability
+    from ..tools.detector import check_ffmpeg
+    ffmpeg_available, _ = check_ffmpeg()
+    if not ffmpeg_available:
+        raise click.ClickException(
+            "FFmpeg is required but not found.\n"
+            "Please install FFmpeg:\n"
+            "  macOS: brew install ffmpeg\n"
+            "  Ubuntu/Debian: sudo apt-get install ffmpeg\n"
+            "  Windows: Download from https://ffmpeg.org/download.html"
+        )
+    
+    # Show current video info
+    if not non_interactive:
+        click.echo("")
+        info = inspect_asset(path)
+        print_inspection(info)
+    
+    video_asset = VideoAsset(path)
+    video_info = video_asset.get_info()
+    if not video_info:
+        raise click.ClickException("Could not read video information")
+    
+    # Determine output format (from option or file extension)
+    output_format = format.lower()
+    if output:
+        output_path = Path(strip_quotes(output))
+        # Detect format from extension if not specified
+        if output_path.suffix.lower() == '.webp':
+            output_format = 'webp'
+        elif output_path.suffix.lower() == '.gif':
+            output_format = 'gif'
+    else:
+        # Generate output path based on format
+        stem = path.stem
+        ext = '.webp' if output_format == 'webp' else '.gif'
+        output_path = path.parent / f"{stem}{ext}"
+    
+    # Check if output file exists (lexists: one lstat, and a dangling
+    # symlink counts as existing)
+    if not overwrite and os.path.lexists(output_path):
+        # Without a terminal nobody can answer the prompt; fail like --non-interactive
+        if non_interactive or not sys.stdin.isatty():
+            raise click.ClickException(f"Output file exists: {output_path}. Use --overwrite to overwrite.")
+        else:
+            if not click.confirm(f"⚠️ Output file {output_path} already exists. Overwrite?"):
+                click.echo("Operation cancelled.")
+                sys.exit(0)
+    
+    # Interactive mode: prompt for missing parameters
+    if not non_interactive:
+        # Format selection prompt (only if format wasn't set via CLI and output path doesn't indicate format)
+        if format == 'gif' and (not output or output_path.suffix.lower() not in ['.webp', '.gif']):
+            format_input = click.prompt(
+                "🎬 Output format: GIF or WebP? (g/w, default: gif)",
+                default="g",
+                type=str
+            ).strip().lower()
+            
+            if format_input in ['w', 'webp']:
+                output_format = 'webp'
+                # Update output path extension if not explicitly set
+                if not output:
+                    stem = path.stem
+                    output_path = path.parent / f"{stem}.webp"
+            else:
+                output_format = 'gif'
+                # Update output path extension if not explicitly set
+                if not output:
+                    stem = path.stem
+                    output_path = path.parent / f"{stem}.gif"
+        
+        # Time range prompt
+        if start_time is None and end_time is None:
+            time_range_input = click.prompt(
+                "⏱️  Time range to convert (e.g., 0-10.5, Enter for full video)",
+                default="",
+                type=str
+            ).strip()
+            
+            if time_range_input:
+                if '-' in time_range_input:
+                    parts = time_range_input.split('-')
+                    if len(parts) == 2:
+                        try:
+                            start_time = float(parts[0].strip())
+                            end_time = float(parts[1].strip())
+                            
+                            # Validate
+                            if start_time < 0:
+                                start_time = 0
+                            if end_time > video_info['duration']:
+                                end_time = video_info['duration']
+                            if start_time >= end_time:
+                                click.echo("⚠️  Warning: Invalid time range. Using full video.", err=True)
+                                start_time = None
+                                end_time = None
+                        except ValueError:
+                            click.echo("⚠️  Warning: Invalid time format. Using full video.", err=True)
+                            start_time = None
+                            end_time = None
+        
+        if width is None:
+            width_input = click.prompt("📏 Target width (press Enter to keep original)", default="", type=str)
+            width = int(width_input) if width_input.strip() else None
+        
+        if fps is None:
+            fps_input = click.prompt("⏱️ Target FPS [recommended: 8-12] (Enter to keep original)", default="", type=str)
+            fps = float(fps_input) if fps_input.strip() else None
+        
+        # Format-specific prompts
+        if output_format == 'gif':
+            if colors is None:
+                colors = ask_optional("🎨 Number of colors [4-256, recommended: 32/64/128] (Enter to keep)", click.IntRange(4, 256))
+        else:  # WebP
+            if quality is None:
+                quality_input = click.prompt("🎨 Quality [recommended: 75-90, default: 85] (Enter for default)", default="85", type=str)
+                quality = int(quality_input) if quality_input.strip() else 85
+                # Validate quality range
+                quality = max(0, min(100, quality))
+    
+    # Perform conversion. An existing output was confirmed (or --overwrite
+    # given) above, so always re-encode instead of skipping it as up to date
+    click.echo(f"\n🔄 Converting video to {output_format.upper()}...")
+    
+    if output_format == 'webp':
+        result = convert_video_to_webp(
+            video_asset,
+            output_path=output_path,
+            width=width,
+            fps=fps,
+            quality=quality,
+            start_time=start_time,
+            end_time=end_time,
+            force=True
+        )
+    else:  # GIF
+        result = convert_video_to_gif(
+            video_asset,
+            output_path=output_path,
+            width=width,
+            fps=fps,
+            colors=colors,
+            start_time=start_time,
+            end_time=end_time,
+            force=True
+        )
+    
+    # Display results
+    if as_json:
+        from ..utils.formatting import write_json
+        write_json(result)
+    else:
+        print_conversion_result(result)
@@ -0,0 +1,25 @@
+"""Inspect command."""
+
+import click
+
+
+@click.command()
+@click.argument("file_path", type=str)
+@click.option("--json", "as_json", is_flag=True, help="Output in JSON format")
+def inspect(file_path: str, as_json: bool):
+    """Inspect an asset file and display its information.
+    
+    FILE_PATH: Path to the asset file to inspect
+    """
+    from pathlib import Path
+    from ..operations.inspect import inspect_asset_cached, print_inspection
+    from ..utils.paths import strip_quotes
+    
+    path = Path(strip_quotes(file_path))
+    info = inspect_asset_cached(path)
+    
+    if as_json:
+        from ..utils.formatting import write_json
+        write_json(info)
+    else:
+        print_inspection(info)
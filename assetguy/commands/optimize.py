@@ -0,0 +1,297 @@
+"""Optimize command."""
+
+import click
+import os
+import sys
+from typing import Optional
+
+from ..config.presets import PRESETS
+
+# Preset names are fixed at import time; membership is a single set probe
+_PRESET_NAMES = frozenset(PRESETS)
+
+
+class PresetType(click.ParamType):
+    """Click parameter type accepting one of the known preset names."""
+    
+    name = "preset"
+    
+    def get_metavar(self, param, ctx=None) -> str:
+        return "[" + "|".join(PRESETS) + "]"
+    
+    def convert(self, value, param, ctx):
+        if value in _PRESET_NAMES:
+            return value
+        choices = ", ".join(repr(name) for name in PRESETS)
+        self.fail(f"{value!r} is not one of {choices}.", param, ctx)
+
+
+_PRESET = PresetType()
+
+
+@click.command()
+@click.argument("file_path", type=str)
+@click.option("--preset", type=_PRESET, help="Use a preset configuration")
+@click.option("--width", type=int, help="Target width in pixels")
+@click.option("--fps", type=float, help="Target FPS (for GIFs and animated WebP)")
+@click.option("--colors", type=int, help="Number of colors (for GIFs)")
+@click.option("--quality", type=int, help="Quality 0-100 (for animated WebP)")
+@click.option("--output", "-o", type=click.Path(), help="Output file path")
+@click.option("--overwrite", is_flag=True, help="Overwrite output file if it exists (non-interactive mode)")
+@click.option("--non-interactive", is_flag=True, help="Run in non-interactive mode")
+@click.option("--json", "as_json", is_flag=True, help="Output result in JSON format")
+def optimize(file_path: str, preset: Optional[str], width: Optional[int], 
+             fps: Optional[float], colors: Optional[int], quality: Optional[int],
+             output: Optional[str], overwrite: bool, non_interactive: bool, as_json: bool):
+    """Optimize an asset file (GIF or image).
+    
+    FILE_PATH: Path to the asset file to optimize
+    
+    Supports both GIF and image optimization with presets, interactive prompts,
+    and non-interactive mode for automation. Animated WebP files are supported
+    with fps and quality parameters.
+    """
+    from pathlib import Path
+    from ..operations.inspect import inspect_asset_cached, print_inspection, detect_asset_type
+    from ..operations.optimize import (
+        optimize_gif,
+        optimize_image,
+        print_optimization_result,
+        format_outputs_result,
+        print_created_files,
+        generate_output_filename,
+        split_gif,
+        plan_trim_outputs,
+        trim_gif_ranges,
+        parse_split_trim_input
+    )
+    from ..assets.gif import GifAsset
+    from ..assets.image import ImageAsset
+    from ..utils.paths import file_sizes, strip_quotes
+    from ..utils.prompts import ask_optional
+    
+    # A missing file is reported by the asset constructor (FileNotFoundError)
+    path = Path(strip_quotes(file_path))
+    
+    # Detect asset type
+    asset_type = detect_asset_type(path)
+    if asset_type not in ['gif', 'image']:
+        raise click.ClickException(f"Unsupported asset type. Supported: GIF and images")
+    
+    # Load preset if provided (PresetType has already validated the name;
+    # the preset is only read, so no copy is needed)
+    preset_config = PRESETS[preset] if preset else {}
+    
+    # Merge preset with CLI flags (CLI flags override preset)
+    cli_opts = {'width': width, 'fps': fps, 'colors': colors, 'quality': quality}
+    opts = {**preset_config, **{k: v for k, v in cli_opts.items() if v is not None}}
+    opt_width, opt_fps, opt_colors, opt_quality = (opts.get(k) for k in cli_opts)
+    
+    # One asset instance serves the whole command, so its metadata is read once
+    asset = GifAsset(path) if asset_type == 'gif' else ImageAsset(path)
+    
+    # Check if this is an animated WebP
+    is_animated_webp = False
+    if asset_type == 'image' and path.suffix.lower() == '.webp':
+        is_animated_webp = asset.is_animated_webp()
+    
+    # Show current asset info, unless nothing will be prompted for: GIFs
+    # always get the split/trim prompt, and without --output the output
+    # filename is asked for
+    if is_animated_webp:
+        prompted = (opt_width, opt_fps, opt_quality)
+    else:
+        prompted = (opt_width,)
+    needs_prompting = asset_type == 'gif' or not output or any(value is None for value in prompted)
+    
+    if not non_interactive and needs_prompting:
+        click.echo("")
+        inspect_info = inspect_asset_cached(path, asset=asset)
+        print_inspection(inspect_info)
+    
+    # Get GIF info for split/trim operations
+    gif_info = None
+    if asset_type == 'gif':
+        gif_info = asset.get_info()
+    
+    # Handle output path
+    output_path = None
+    if output:
+        output_path = Path(strip_quotes(output))
+    else:
+        output_path = generate_output_filename(path)
+    
+    # Check if output file exists (lexists: one lstat, and a dangling
+    # symlink counts as existing)
+    if not overwrite and os.path.lexists(output_path):
+        # Without a terminal nobody can answer the prompt; fail like --non-interactive
+        if non_interactive or not sys.stdin.isatty():
+            raise click.ClickException(f"Output file exists: {output_path}. Use --overwrite to overwrite.")
+        else:
+            if not click.confirm(f"⚠️ Output file {output_path} already exists. Overwrite?"):
+                click.echo("Operation cancelled.")
+                sys.exit(0)
+    
+    # Interactive mode: prompt for missing parameters
+    if not non_interactive:
+        if asset_type == 'gif' and gif_info:
+            # Unified split/trim input
+            split_trim_input = click.prompt(
+                "✂️  Time range or split points (e.g., 2.5,3.5 for split, 0-2.5 for trim, f:10,50 for frames, Enter to skip)",
+                default="",
+                type=str
+            ).strip()
+            
+            if split_trim_input:
+                parsed = parse_split_trim_input(
+                    split_trim_input,
+                    gif_info['duration'],
+                    gif_info['frames'],
+                    asset
+                )
+                
+                if parsed:
+                    if parsed['mode'] == 'split':
+                        # Handle split operation
+                        output_dir = output_path.parent if output_path else path.parent
+                        output_files = split_gif(
+                            asset,
+                            split_points=parsed['points'],
+                            output_dir=output_dir,
+                            width=opt_width,
+                            fps=opt_fps,
+                            fps_mode="normalize",
+                            colors=opt_colors
+                        )
+                        
+                        if output_files:
+                            print_created_files(output_files, file_sizes(output_files), "segment(s)")
+                        else:
+                            click.echo("⚠️  Warning: No segments were created.", err=True)
+                        sys.exit(0)
+                    
+                    elif parsed['mode'] == 'trim':
+                        # Handle trim operation(s) - may be multiple ranges
+                        trim_ranges = parsed['ranges']
+                        trim_output_paths = plan_trim_outputs(output_path, len(trim_ranges))
+                        output_files = []
+                        
+                        errors = trim_gif_ranges(
+                            asset,
+                            trim_ranges,
+                            trim_output_paths,
+                            is_frame=parsed['is_frame'],
+                            width=opt_width,
+                            fps=opt_fps,
+                            fps_mode="normalize",
+                            colors=opt_colors
+                        )
+                        for i, (trim_output_path, error) in enumerate(zip(trim_output_paths, errors)):
+                            if error is None:
+                                output_files.append(trim_output_path)
+                            else:
+                                click.echo(f"⚠️  Warning: Failed to create trim {i+1}: {error}", err=True)
+                        
+                        if output_files:
+                            # One size lookup feeds both output formats
+                            sizes = file_sizes(output_files)
+                            if as_json:
+                                from ..utils.formatting import write_json
+                                write_json(format_outputs_result('trim', path, output_files, sizes))
+                            else:
+                                print_created_files(output_files, sizes, "trimmed file(s)")
+                        else:
+                            click.echo("⚠️  Warning: No trimmed files were created.", err=True)
+                        sys.exit(0)
+                else:
+                    click.echo("⚠️  Warning: Invalid input format. Skipping split/trim.", err=True)
+            
+            # Continue with normal optimization prompts
+            if opt_width is None:
+                opt_width = ask_optional("📏 Target width (press Enter to skip)", int)
+            
+            if opt_fps is None:
+                opt_fps = ask_optional("⏱️ Target FPS [recommended: 8-12] (Enter to skip)", float)
+            
+            if opt_colors is None:
+                opt_colors = ask_optional("🎨 Number of colors [recommended: 32/64/128] (Enter to keep)", int)
+            
+            # Prompt for output filename if not provided
+            if not output:
+                default_output = str(output_path)
+                output_input = click.prompt("💾 Output filename", default=default_output, type=str)
+                output_path = Path(output_input)
+        
+        elif asset_type == 'image':
+            # Check if animated WebP
+            if is_animated_webp:
+                if opt_width is None:
+                    opt_width = ask_optional("📏 Target width (press Enter to skip)", int)
+                
+                if opt_fps is None:
+                    opt_fps = ask_optional("⏱️ Target FPS [recommended: 8-12] (Enter to skip)", float)
+                
+                if opt_quality is None:
+                    quality_input = click.prompt("🎨 Quality [recommended: 75-90, default: 85] (Enter for default)", default="85", type=str)
+                    opt_quality = int(quality_input) if quality_input.strip() else 85
+                    # Validate quality range
+                    opt_quality = max(0, min(100, opt_quality))
+            else:
+                # Static image
+                if opt_width is None:
+                    opt_width = ask_optional("📏 Target width (press Enter to skip)", int)
+            
+            # Prompt for output filename if not provided
+            if not output:
+                default_output = str(output_path)
+                output_input = click.prompt("💾 Output filename", default=default_output, type=str)
+                output_path = Path(output_input)
+    
+    # Validate that at least one optimization parameter is provided
+    if asset_type == 'gif':
+        if not any((opt_width, opt_fps, opt_colors)):
+            raise click.ClickException("At least one optimization parameter (--width, --fps, or --colors) or --preset must be provided.")
+    elif opt_width is None:
+        # Images (static or animated WebP) require width; fps and quality are optional
+        kind = "animated WebP" if is_animated_webp else "image"
+        raise click.ClickException(f"--width or --preset must be provided for {kind} optimization.")
+    
+    # Perform optimization
+    click.echo("\n🔄 Optimizing asset...")
+    
+    if asset_type == 'gif':
+        result = optimize_gif(
+            asset,
+            output_path=output_path,
+            width=opt_width,
+            fps=opt_fps,
+            fps_mode="normalize",
+            colors=opt_colors
+        )
+    elif asset_type == 'image':
+        if is_animated_webp:
+            # Use optimize_animated_webp for animated WebP
+            from ..operations.optimize import optimize_animated_webp
+            result = optimize_animated_webp(
+                asset,
+                output_path=output_path,
+                width=opt_width,
+                fps=opt_fps,
+                quality=opt_quality
+            )
+        else:
+            # Use optimize_image for static images
+            result = optimize_image(
+                asset,
+                output_path=output_path,
+                width=opt_width
+            )
+    else:
+        raise click.ClickException(f"Unsupported asset type: {asset_type}")
+    
+    # Display results
+    if as_json:
+        from ..utils.formatting import write_json
+        write_json(result)
+    else:
+        print_optimization_result(result)
@@ -0,0 +1,11 @@
+"""Presets command."""
+
+import click
+
+
+@click.command()
+def presets():
+    """List available presets."""
+    from ..config.presets import RENDERED_PRESETS
+    
+    click.echo(RENDERED_PRESETS)
@@ -0,0 +1,253 @@
+"""Split/trim command."""
+
+import click
+from typing import Optional
+
+
+@click.command()
+@click.argument("file_path", type=str)
+@click.option("--time-points", type=str, help="Comma-separated time points to split at (e.g., '2.5,5.0')")
+@click.option("--frame-points", type=str, help="Comma-separated frame numbers to split at (e.g., '10,50')")
+@click.option("--time-range", type=str, help="Time range to extract (e.g., '2.5-5.0')")
+@click.option("--frame-range", type=str, help="Frame range to extract (e.g., '10-50')")
+@click.option("--width", type=int, help="Target width in pixels")
+@click.option("--fps", type=float, help="Target FPS (for GIFs)")
+@click.option("--colors", type=int, help="Number of colors (for GIFs)")
+@click.option("--output", "-o", type=click.Path(), help="Output directory or file path")
+@click.option("--overwrite", is_flag=True, help="Overwrite output files if they exist")
+@click.option("--non-interactive", is_flag=True, help="Run in non-interactive mode")
+@click.option("--json", "as_json", is_flag=True, help="Output result in JSON format")
+def split(file_path: str, time_points: Optional[str], frame_points: Optional[str],
+          time_range: Optional[str], frame_range: Optional[str],
+          width: Optional[int], fps: Optional[float], colors: Optional[int],
+          output: Optional[str], overwrite: bool, non_interactive: bool, as_json: bool):
+    """Split or trim a GIF file by time or frame ranges.
+    
+    FILE_PATH: Path to the GIF file to split/trim
+    
+    Use --time-points or --frame-points to split into multiple files.
+    Use --time-range or --frame-range to trim/extract a single range.
+    """
+    from pathlib import Path
+    from ..operations.inspect import inspect_asset, print_inspection, detect_asset_type
+    from ..operations.optimize import (
+        print_optimization_result,
+        format_optimization_result,
+        format_outputs_result,
+        print_created_files,
+        generate_output_filename,
+        split_gif,
+        plan_trim_outputs,
+        trim_gif_ranges,
+        parse_split_frames,
+        parse_ranges,
+        parse_split_times,
+        parse_split_trim_input
+    )
+    from ..assets.gif import GifAsset
+    from ..utils.paths import file_sizes, strip_quotes
+    from ..utils.prompts import ask_optional
+    
+    # A missing file is reported by the asset constructor (FileNotFoundError)
+    path = Path(strip_quotes(file_path))
+    
+    # Detect asset type
+    asset_type = detect_asset_type(path)
+    if asset_type != 'gif':
+        raise click.ClickException(f"Split/trim only supports GIF files. Got: {asset_type}")
+    
+    gif_asset = GifAsset(path)
+    info = gif_asset.get_info()
+    if not info:
+        # Check if ImageMagick is available
+        from ..tools.detector import get_imagemagick_command
+        magick_cmd = get_imagemagick_command()
+        if not magick_cmd:
+            raise click.ClickException(
+                "Could not read GIF information. ImageMagick is required but not found.\n"
+                "Please install ImageMagick:\n"
+                "  macOS: brew install imagemagick\n"
+                "  Ubuntu/Debian: sudo apt-get install imagemagick\n"
+                "  Windows: Download from https://imagemagick.org/script/download.php"
+            )
+        raise click.ClickException(
+            f"Could not read GIF information. "
+            f"ImageMagick command '{magick_cmd}' is available but failed to read the file. "
+            "The file may be corrupted or in an unsupported format."
+        )
+    
+    # Determine operation mode and parameters
+    split_points = None
+    trim_range = None
+    trim_ranges = None  # For multiple trim ranges
+    is_frame_based_trim = False  # Track if trim is frame-based
+    is_split = False
+    is_trim = False
+    
+    # Check for split operations
+    if time_points:
+        split_points = parse_split_times(time_points, info['duration'])
+        if not split_points:
+            raise click.ClickException(f"Invalid time points: {time_points}")
+        is_split = True
+    elif frame_points:
+        frame_nums = parse_split_frames(frame_points, info['frames'])
+        if not frame_nums:
+            raise click.ClickException(f"Invalid frame points: {frame_points}")
+        # Convert frames to time points
+        split_points = gif_asset.frames_to_time_points(frame_nums)
+        if not split_points:
+            raise click.ClickException(f"Could not convert frame points to time points")
+        is_split = True
+    
+    # Check for trim operations
+    elif time_range:
+        # Support multiple ranges (comma-separated)
+        trim_ranges = parse_ranges(time_range, info['duration'])
+        if not trim_ranges:
+            plural = "s" if ',' in time_range else ""
+            raise click.ClickException(f"Invalid time range{plural}: {time_range}")
+        trim_range = trim_ranges[0]  # For backward compatibility
+        is_trim = True
+        is_frame_based_trim = False
+    elif frame_range:
+        # Support multiple ranges (comma-separated)
+        trim_ranges = parse_ranges(frame_range, info['frames'], is_frame=True)
+        if not trim_ranges:
+            plural = "s" if ',' in frame_range else ""
+            raise click.ClickException(f"Invalid frame range{plural}: {frame_range}")
+        trim_range = trim_ranges[0]  # For backward compatibility
+        is_trim = True
+        is_frame_based_trim = True
+    
+    # Show current asset info, unless the operation and all optimization
+    # options were already given on the command line
+    needs_prompting = not (is_split or is_trim) or None in (width, fps, colors)
+    if not non_interactive and needs_prompting:
+        click.echo("")
+        print_inspection(inspect_asset(path, gif_asset))
+    
+    # Interactive mode: prompt if no operation specified
+    if not is_split and not is_trim and not non_interactive:
+        split_trim_input = click.prompt(
+            "✂️  Time range or split points (e.g., 2.5,3.5 for split, 0-2.5 for trim, f:10,50 for frames, Enter to skip)",
+            default="",
+            type=str
+        ).strip()
+        
+        if split_trim_input:
+            parsed = parse_split_trim_input(
+                split_trim_input,
+                info['duration'],
+                info['frames'],
+                gif_asset
+            )
+            
+            if parsed:
+                if parsed['mode'] == 'split':
+                    split_points = parsed['points']
+                    is_split = True
+                elif parsed['mode'] == 'trim':
+                    trim_ranges = parsed['ranges']
+                    trim_range = trim_ranges[0] if trim_ranges else None
+                    is_trim = True
+                    is_frame_based_trim = parsed['is_frame']
+            else:
+                raise click.ClickException("Invalid input format")
+    
+    # Validate that an operation was specified
+    if not is_split and not is_trim:
+        raise click.ClickException("Must specify --time-points, --frame-points, --time-range, or --frame-range")
+    
+    # Handle output path
+    if output:
+        output_path = Path(strip_quotes(output))
+        # If it's a directory for split, use it; otherwise treat as file path
+        if is_split and output_path.is_dir():
+            pass  # Use as-is
+        elif is_split:
+            # For split, if output is a file, use its parent as directory
+            output_path = output_path.parent
+    else:
+        if is_split:
+            output_path = path.parent
+        else:
+            output_path = generate_output_filename(path, suffix="_trimmed")
+    
+    # Interactive prompts for optimization options
+    if not non_interactive:
+        if width is None:
+            width = ask_optional("📏 Target width (press Enter to skip)", int)
+        
+        if fps is None:
+            fps = ask_optional("⏱️ Target FPS [recommended: 8-12] (Enter to skip)", float)
+        
+        if colors is None:
+            colors = ask_optional("🎨 Number of colors [recommended: 32/64/128] (Enter to keep)", int)
+    
+    # Perform split or trim operation
+    click.echo("\n🔄 Processing...")
+    
+    if is_split:
+        # Split operation
+        output_files = split_gif(
+            gif_asset,
+            split_points=split_points,
+            output_dir=output_path if output_path.is_dir() else output_path.parent,
+            width=width,
+            fps=fps,
+            fps_mode="normalize",
+            colors=colors
+        )
+        
+        if output_files:
+            # One size lookup feeds both output formats
+            sizes = file_sizes(output_files)
+            if as_json:
+                from ..utils.formatting import write_json
+                write_json(format_outputs_result('split', path, output_files, sizes))
+            else:
+                print_created_files(output_files, sizes, "segment(s)")
+        else:
+            raise click.ClickException("No segments were created")
+    
+    elif is_trim:
+        # Trim operation(s) - may be multiple ranges
+        if trim_ranges is None:
+            trim_ranges = [trim_range] if trim_range else []
+        
+        # Multiple trims are numbered after the output file if it exists,
+        # otherwise after the input file
+        trim_output_paths = plan_trim_outputs(output_path, len(trim_ranges), fallback_path=path)
+        output_files = []
+        
+        errors = trim_gif_ranges(
+            gif_asset,
+            trim_ranges,
+            trim_output_paths,
+            is_frame=is_frame_based_trim,
+            width=width,
+            fps=fps,
+            fps_mode="normalize",
+            colors=colors
+        )
+        for i, (trim_output_path, error) in enumerate(zip(trim_output_paths, errors)):
+            if error is None:
+                output_files.append(trim_output_path)
+            else:
+                click.echo(f"⚠️  Warning: Failed to create trim {i+1}: {error}", err=True)
+        
+        if output_files:
+            # One size lookup feeds both output formats
+            sizes = file_sizes(output_files)
+            if as_json:
+                from ..utils.formatting import write_json
+                write_json(format_outputs_result('trim', path, output_files, sizes))
+            elif len(output_files) > 1:
+                print_created_files(output_files, sizes, "trimmed file(s)")
+            else:
+                # Single file - use optimization result format
+                result = format_optimization_result(path, output_files[0], gif_asset.size_bytes, sizes[0])
+                print_optimization_result(result)
+        else:
+            raise click.ClickException("No trimmed files were created")
@@ -1,6 +1,31 @@
-"""Configuration management for assetguy."""
+"""Configuration management for assetguy.
 
-from .manager import ConfigManager
-from .presets import get_preset, list_presets, PRESETS
+Names are resolved lazily on first access, so reading presets does not
+import the YAML-backed config manager.
+"""
 
-__all__ = ['ConfigManager', 'get_preset', 'list_presets', 'PRESETS']
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'ConfigManager': 'manager',
+    'get_preset': 'presets',
+    'list_presets': 'presets',
+    'PRESETS': 'presets',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
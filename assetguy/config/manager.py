@@ -1,11 +1,101 @@
 """Unified configuration manager for assetguy."""
 
 import os
+import tempfile
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Optional
 
-from ..utils.paths import expand_path
+# libyaml bindings when PyYAML was built with them, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file.
+    
+    Cached per (path, mtime, size) so an unchanged file is parsed only once
+    per process; any modification changes the key and forces a re-parse.
+    Callers must not mutate the returned dictionary.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _at_least(cast: Callable[[Any], Any], minimum: Any) -> Callable[[str, Any], Any]:
+    """Build a validator that converts a value with cast and checks a lower bound."""
+    def validate(key: str, value: Any) -> Any:
+        value = cast(value)
+        if value < minimum:
+            raise ValueError(f"{key} must be >= {minimum}")
+        return value
+    return validate
+
+
+def _between(cast: Callable[[Any], Any], low: Any, high: Any) -> Callable[[str, Any], Any]:
+    """Build a validator that converts a value with cast and checks an inclusive range."""
+    def validate(key: str, value: Any) -> Any:
+        value = cast(value)
+        if not low <= value <= high:
+            raise ValueError(f"{key} must be between {low} and {high}")
+        return value
+    return validate
+
+
+_VIDEO_METHODS = frozenset({"ssim", "histogram", "pixel_diff", "combined"})
+_IMAGE_FORMATS = frozenset({"png", "jpg", "jpeg", "webp"})
+
+
+def _validate_video_method(key: str, value: Any) -> Any:
+    """Check that a value is a known keyframe detection method."""
+    if value not in _VIDEO_METHODS:
+        raise ValueError("video_method must be one of: ssim, histogram, pixel_diff, combined")
+    return value
+
+
+def _validate_image_format(key: str, value: Any) -> Any:
+    """Check that a value is a supported image format or None."""
+    if value is not None and value not in _IMAGE_FORMATS:
+        raise ValueError(f"{key} must be one of: png, jpg, jpeg, webp, or None")
+    return value
+
+
+def _validate_bool(key: str, value: Any) -> Any:
+    """Coerce a value to bool."""
+    return bool(value) if not isinstance(value, bool) else value
+
+
+def _validate_output_path(key: str, value: Any) -> Any:
+    """Expand a non-empty output path."""
+    if value is not None and value != "":
+        # Only this key needs path expansion; import on use
+        from ..utils.paths import expand_path
+        
+        value = str(expand_path(value) or value)
+    return value
+
+
+# Config key -> validator(key, value) returning the value to store.
+# Keys not listed here (gif_default_width, default_preset, ...) are kept as-is.
+_VALIDATORS: Dict[str, Callable[[str, Any], Any]] = {
+    "gif_default_fps": _at_least(float, 0),
+    "video_min_gap": _at_least(float, 0),
+    # FFmpeg's palettegen (convert) accepts 4-256 colors
+    "gif_default_colors": _between(int, 4, 256),
+    "video_frame_skip": _at_least(int, 1),
+    "image_default_quality": _between(int, 1, 100),
+    "video_jpg_quality": _between(int, 1, 100),
+    "video_threshold": _between(float, 0.0, 1.0),
+    "video_method": _validate_video_method,
+    "video_image_format": _validate_image_format,
+    "image_default_format": _validate_image_format,
+    "video_always_capture_first": _validate_bool,
+    "video_output_path": _validate_output_path,
+}
 
 
 class ConfigManager:
@@ -39,97 +129,139 @@ class ConfigManager:
         "default_preset": None,  # None means no default preset
     }
     
-    def __init__(self):
-        """Initialize config manager and ensure config file exists."""
+    # One shared instance per config file (see __new__)
+    _instances: Dict[Path, 'ConfigManager'] = {}
+    
+    # No per-instance __dict__; the class-level CONFIG_DIR/CONFIG_FILE are
+    # only defaults, an instance's actual paths live in _config_dir/_config_file
+    __slots__ = ('_config_file', '_config_dir', '_config', '_loaded_mtime', '_initialized')
+    
+    def __new__(cls, config_file: Optional[Path] = None):
+        key = Path(config_file) if config_file is not None else cls.CONFIG_FILE
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            cls._instances[key] = instance
+        return instance
+    
+    def __init__(self, config_file: Optional[Path] = None):
+        """Initialize config manager and ensure config file exists.
+        
+        Instances are shared per config file; constructing the manager again
+        reuses the loaded configuration unless the file has changed since.
+        
+        Args:
+            config_file: Optional path to the config file (default: ~/.assetguy/config.yaml)
+        """
+        if self._initialized:
+            if self._config is not None and self._config_mtime() != self._loaded_mtime:
+                self._config = None
+            return
+        
+        self._config_file = Path(config_file) if config_file is not None else self.CONFIG_FILE
+        self._config_dir = self._config_file.parent
         self._config: Optional[Dict[str, Any]] = None
+        self._loaded_mtime: Optional[int] = None
         self._ensure_config_exists()
+        self._initialized = True
+    
+    def _config_mtime(self) -> Optional[int]:
+        """Get the config file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self._config_file).st_mtime_ns
+        except OSError:
+            return None
     
     def _ensure_config_exists(self):
-        """Create config directory and default config file if they don't exist."""
-        if not self.CONFIG_DIR.exists():
-            self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        """Create config directory and default config file if they don't exist.
         
-        if not self.CONFIG_FILE.exists():
-            self._write_config(self.DEFAULT_CONFIG.copy())
+        Runs once per shared instance (see __init__); an existing config
+        file, the usual case, costs a single stat.
+        """
+        if self._config_file.exists():
+            return
+        
+        self._config_dir.mkdir(parents=True, exist_ok=True)
+        self._write_config(self.DEFAULT_CONFIG.copy())
     
     def _read_config(self) -> Dict[str, Any]:
         """Read configuration from file."""
-        if not self.CONFIG_FILE.exists():
+        if not self._config_file.exists():
             return self.DEFAULT_CONFIG.copy()
         
         try:
-            with open(self.CONFIG_FILE, 'r') as f:
-                config = yaml.safe_load(f) or {}
-                # Merge with defaults to ensure all keys exist
-                merged = self.DEFAULT_CONFIG.copy()
-                merged.update(config)
-                return merged
+            stat = os.stat(self._config_file)
+            config = _load_config_file(str(self._config_file), stat.st_mtime_ns, stat.st_size)
+            # Merge with defaults to ensure all keys exist
+            merged = self.DEFAULT_CONFIG.copy()
+            merged.update(config)
+            return merged
         except Exception as e:
             print(f"Warning: Could not read config file: {e}")
             return self.DEFAULT_CONFIG.copy()
     
     def _write_config(self, config: Dict[str, Any]):
-        """Write configuration to file."""
+        """Write configuration to file.
+        
+        The YAML is rendered in memory, written to a temp file in the config
+        directory with a single write and renamed over the config file, so
+        concurrent readers never see a partially written file.
+        """
         try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            text = yaml.dump(config, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+            fd, tmp_file = tempfile.mkstemp(suffix='.tmp', prefix='config_', dir=str(self._config_dir))
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(text)
+                # mkstemp creates the file as 0600; keep an existing file's mode
+                if self._config_file.exists():
+                    os.chmod(tmp_file, self._config_file.stat().st_mode & 0o777)
+                os.replace(tmp_file, self._config_file)
+            except BaseException:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
         except Exception as e:
             raise Exception(f"Could not write config file: {e}")
     
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration."""
+    @property
+    def _data(self) -> Dict[str, Any]:
+        """Loaded configuration, read from file on first access (not a copy)."""
         if self._config is None:
+            self._loaded_mtime = self._config_mtime()
             self._config = self._read_config()
-        return self._config.copy()
+        return self._config
+    
+    def __contains__(self, key: str) -> bool:
+        """Check whether a config key is set (including keys set to None)."""
+        return key in self._data
+    
+    def __getitem__(self, key: str) -> Any:
+        """Get a config value, raising KeyError if the key is not set."""
+        return self._data[key]
+    
+    def get_config(self) -> Dict[str, Any]:
+        """Get current configuration."""
+        return self._data.copy()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a specific config value."""
-        config = self.get_config()
-        return config.get(key, default)
+        return self._data.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set a config value and save to file."""
         config = self.get_config()
         
-        # Validate value based on key
-        if key in ["gif_default_fps", "video_min_gap"]:
-            value = float(value)
-            if value < 0:
-                raise ValueError(f"{key} must be >= 0")
-        elif key in ["gif_default_colors", "video_frame_skip", "image_default_quality", "video_jpg_quality"]:
-            value = int(value)
-            if key in ["image_default_quality", "video_jpg_quality"]:
-                if not 1 <= value <= 100:
-                    raise ValueError(f"{key} must be between 1 and 100")
-            elif key in ["gif_default_colors"]:
-                if value < 2 or value > 256:
-                    raise ValueError(f"{key} must be between 2 and 256")
-            elif key == "video_frame_skip":
-                if value < 1:
-                    raise ValueError(f"{key} must be >= 1")
-        elif key == "video_threshold":
-            value = float(value)
-            if not 0.0 <= value <= 1.0:
-                raise ValueError("video_threshold must be between 0.0 and 1.0")
-        elif key == "video_method":
-            if value not in ["ssim", "histogram", "pixel_diff", "combined"]:
-                raise ValueError("video_method must be one of: ssim, histogram, pixel_diff, combined")
-        elif key in ["video_image_format", "image_default_format"]:
-            if value is not None and value not in ["png", "jpg", "jpeg", "webp"]:
-                raise ValueError(f"{key} must be one of: png, jpg, jpeg, webp, or None")
-        elif key in ["video_always_capture_first"]:
-            value = bool(value) if not isinstance(value, bool) else value
-        elif key in ["gif_default_width", "video_output_path", "default_preset"]:
-            # Expand paths if provided
-            if value is not None and value != "":
-                if key == "video_output_path":
-                    value = str(expand_path(value) or value)
-                else:
-                    value = value  # Keep as-is for width and preset
+        # Validate/convert the value; keys without a validator are stored as given
+        validator = _VALIDATORS.get(key)
+        if validator is not None:
+            value = validator(key, value)
         
         config[key] = value
         self._write_config(config)
         self._config = config
+        self._loaded_mtime = self._config_mtime()
     
     def reset(self):
         """Reset config to defaults."""
@@ -138,4 +270,4 @@ class ConfigManager:
     
     def get_config_path(self) -> str:
         """Get the path to the config file."""
-        return str(self.CONFIG_FILE)
+        return str(self._config_file)
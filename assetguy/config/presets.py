@@ -1,6 +1,7 @@
 """Preset definitions for different use cases."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 # Preset definitions
 PRESETS: Dict[str, Dict[str, Any]] = {
@@ -25,28 +26,49 @@ PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def get_preset(name: str) -> Dict[str, Any]:
+def get_preset(name: str) -> Mapping[str, Any]:
     """Get preset configuration by name.
     
     Args:
         name: Preset name (docs, web, marketing)
         
     Returns:
-        Preset configuration dictionary
+        Read-only preset configuration mapping (copy it with dict() to modify)
         
     Raises:
         KeyError: If preset name doesn't exist
     """
-    if name not in PRESETS:
+    if name not in _PRESETS_VIEW:
         available = ", ".join(PRESETS.keys())
         raise KeyError(f"Unknown preset '{name}'. Available presets: {available}")
-    return PRESETS[name].copy()
+    return _PRESETS_VIEW[name]
 
 
-def list_presets() -> Dict[str, Dict[str, Any]]:
+def list_presets() -> Mapping[str, Mapping[str, Any]]:
     """List all available presets.
     
     Returns:
-        Dictionary of all presets
+        Read-only mapping of all presets (the presets are read-only too)
     """
-    return PRESETS.copy()
+    return _PRESETS_VIEW
+
+
+def _render_presets(presets: Mapping[str, Dict[str, Any]]) -> str:
+    """Render presets as the text printed by the presets command."""
+    lines: List[str] = ["Available presets:", ""]
+    for name, config in presets.items():
+        lines.append(f"  {name}:")
+        lines.append(f"    {config.get('description', 'No description')}")
+        for key, value in config.items():
+            if key != 'description':
+                lines.append(f"    {key}: {value}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# Presets are static, so the read-only view and the rendered listing are
+# built once at import time; lookups hand out these views instead of copies
+_PRESETS_VIEW: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType(config) for name, config in PRESETS.items()
+})
+RENDERED_PRESETS: str = _render_presets(PRESETS)
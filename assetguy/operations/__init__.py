@@ -1,42 +1,54 @@
-"""Operations for asset manipulation."""
-
-from .inspect import inspect_asset, detect_asset_type, print_inspection
-from .compare import compare_assets, print_comparison
-from .optimize import (
-    split_gif,
-    trim_gif,
-    optimize_gif,
-    optimize_image,
-    generate_output_filename,
-    format_optimization_result,
-    print_optimization_result,
-    parse_frame_range,
-    parse_split_frames,
-    parse_time_range,
-    parse_split_times,
-    parse_split_trim_input
-)
-from .convert import convert_video_to_gif, convert_video_to_webp, print_conversion_result
-
-__all__ = [
-    'inspect_asset',
-    'detect_asset_type',
-    'print_inspection',
-    'compare_assets',
-    'print_comparison',
-    'split_gif',
-    'trim_gif',
-    'optimize_gif',
-    'optimize_image',
-    'generate_output_filename',
-    'format_optimization_result',
-    'print_optimization_result',
-    'parse_frame_range',
-    'parse_split_frames',
-    'parse_time_range',
-    'parse_split_times',
-    'parse_split_trim_input',
-    'convert_video_to_gif',
-    'convert_video_to_webp',
-    'print_conversion_result',
-]
+"""Operations for asset manipulation.
+
+Names are resolved lazily on first access, so importing one operation module
+(e.g. ``assetguy.operations.inspect``) does not import the others.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'inspect_asset': 'inspect',
+    'inspect_asset_cached': 'inspect',
+    'inspect_assets': 'inspect',
+    'detect_asset_type': 'inspect',
+    'print_inspection': 'inspect',
+    'compare_assets': 'compare',
+    'print_comparison': 'compare',
+    'split_gif': 'optimize',
+    'trim_gif': 'optimize',
+    'trim_gif_ranges': 'optimize',
+    'optimize_gif': 'optimize',
+    'optimize_image': 'optimize',
+    'generate_output_filename': 'optimize',
+    'plan_trim_outputs': 'optimize',
+    'format_optimization_result': 'optimize',
+    'print_optimization_result': 'optimize',
+    'format_outputs_result': 'optimize',
+    'print_created_files': 'optimize',
+    'parse_frame_range': 'optimize',
+    'parse_split_frames': 'optimize',
+    'parse_time_range': 'optimize',
+    'parse_ranges': 'optimize',
+    'parse_split_times': 'optimize',
+    'parse_split_trim_input': 'optimize',
+    'convert_video_to_gif': 'convert',
+    'convert_video_to_webp': 'convert',
+    'print_conversion_result': 'convert',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,72 @@
 """Asset comparison operations."""
 
-import os
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
 from ..assets.gif import GifAsset
-from ..utils.formatting import filesize_mb, format_file_size
+from .inspect import detect_asset_type
+
+
+# Properties copied from the GIF info into each asset's summary
+_INFO_FIELDS = ("width", "height", "frames", "duration", "fps", "colors")
+
+
+def _asset_summary(path: Path, size_bytes: int, info: Mapping[str, Any]) -> Dict[str, Any]:
+    """Build the per-asset part of a comparison."""
+    summary = {"path": str(path), "size_mb": size_bytes / (1024 * 1024), "size_bytes": size_bytes}
+    summary.update((key, info[key]) for key in _INFO_FIELDS)
+    return summary
+
+
+def _change(asset1: Dict[str, Any], asset2: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Difference of a property with its relative change and a description of it."""
+    val1 = asset1[key]
+    diff = asset2[key] - val1
+    if val1:
+        percent = diff / val1 * 100
+        if abs(percent) < 0.1:
+            description = "Same"
+        elif percent > 0:
+            description = f"+{percent:.1f}% (larger)"
+        else:
+            description = f"{abs(percent):.1f}% (smaller)"
+    elif diff:
+        percent, description = float('inf'), "+∞"
+    else:
+        percent, description = "N/A", "N/A"
+    return {"diff": diff, "percent": percent, "description": description}
+
+
+def _delta(asset1: Dict[str, Any], asset2: Dict[str, Any], key: str, tolerance: float = 1) -> Dict[str, Any]:
+    """Difference of a property; values less than tolerance apart count as the same."""
+    diff = asset2[key] - asset1[key]
+    return {"diff": diff, "same": abs(diff) < tolerance}
+
+
+def _dimensions_delta(asset1: Dict[str, Any], asset2: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Difference of width and height (key is unused)."""
+    width_diff = asset2["width"] - asset1["width"]
+    height_diff = asset2["height"] - asset1["height"]
+    return {
+        "same": width_diff == 0 and height_diff == 0,
+        "width_diff": width_diff,
+        "height_diff": height_diff
+    }
+
+
+# Differences between the two assets, in report order:
+# key -> builder(asset1 summary, asset2 summary, key)
+_DIFFERENCES: Tuple[Tuple[str, Callable[[Dict[str, Any], Dict[str, Any], str], Dict[str, Any]]], ...] = (
+    ("size_mb", _change),
+    ("size_bytes", _change),
+    ("dimensions", _dimensions_delta),
+    ("frames", _delta),
+    ("duration", _change),
+    ("fps", partial(_delta, tolerance=0.01)),
+    ("colors", _delta),
+)
 
 
 def compare_assets(asset1_path: Path, asset2_path: Path) -> Dict[str, Any]:
@@ -17,116 +78,49 @@ def compare_assets(asset1_path: Path, asset2_path: Path) -> Dict[str, Any]:
         
     Returns:
         Dictionary containing comparison results
+    
+    Raises:
+        AssetNotFoundError: If either file is missing
+        ValueError: If either file is not a GIF or its metadata cannot be read
     """
     # For now, only support GIF comparison
     # TODO: Extend to support other asset types
     
-    if not asset1_path.exists():
-        raise FileNotFoundError(f"Asset not found: {asset1_path}")
-    if not asset2_path.exists():
-        raise FileNotFoundError(f"Asset not found: {asset2_path}")
+    # Reject non-GIF inputs by suffix, then by signature, before any metadata
+    # is read (the signature read raises AssetNotFoundError for a missing file)
+    for path in (asset1_path, asset2_path):
+        asset_type = detect_asset_type(Path(path))
+        if asset_type != 'gif':
+            raise ValueError(f"Compare only supports GIF files. Got: {asset_type} ({path})")
+        if not GifAsset.has_signature(path):
+            raise ValueError(f"Not a valid GIF file: {path}")
     
-    # Determine asset types and create asset objects
+    # Create asset objects
     asset1 = GifAsset(asset1_path)
     asset2 = GifAsset(asset2_path)
     
-    info1 = asset1.get_info()
-    info2 = asset2.get_info()
+    # Read both files concurrently on the shared asset worker pool
+    info1, info2 = GifAsset.bulk_info((asset1, asset2))
     
     if not info1:
         raise ValueError(f"Could not read information from {asset1_path}")
     if not info2:
         raise ValueError(f"Could not read information from {asset2_path}")
     
-    # Get file sizes
-    size1 = filesize_mb(asset1_path)
-    size1_bytes = asset1.size_bytes
-    size2 = filesize_mb(asset2_path)
-    size2_bytes = asset2.size_bytes
-    
-    # Calculate percentage differences
-    def calc_percent_diff(val1, val2):
-        if val1 == 0:
-            return "N/A" if val2 == 0 else float('inf')
-        return ((val2 - val1) / val1) * 100
-    
-    def format_diff_descriptive(val1, val2):
-        """Format difference with descriptive text."""
-        diff = calc_percent_diff(val1, val2)
-        if diff == "N/A":
-            return "N/A"
-        if isinstance(diff, float) and diff == float('inf'):
-            return "+∞"
-        if isinstance(diff, (int, float)):
-            if abs(diff) < 0.1:
-                return "Same"
-            elif diff > 0:
-                return f"+{diff:.1f}% (larger)"
-            else:
-                return f"{abs(diff):.1f}% (smaller)"
-        return str(diff)
-    
-    # Build comparison dictionary
-    comparison = {
-        "asset1": {
-            "path": str(asset1_path),
-            "size_mb": size1,
-            "size_bytes": size1_bytes,
-            "width": info1['width'],
-            "height": info1['height'],
-            "frames": info1['frames'],
-            "duration": info1['duration'],
-            "fps": info1['fps'],
-            "colors": info1['colors'],
-        },
-        "asset2": {
-            "path": str(asset2_path),
-            "size_mb": size2,
-            "size_bytes": size2_bytes,
-            "width": info2['width'],
-            "height": info2['height'],
-            "frames": info2['frames'],
-            "duration": info2['duration'],
-            "fps": info2['fps'],
-            "colors": info2['colors'],
-        },
-        "differences": {
-            "size_mb": {
-                "diff": size2 - size1,
-                "percent": calc_percent_diff(size1, size2),
-                "description": format_diff_descriptive(size1, size2)
-            },
-            "size_bytes": {
-                "diff": size2_bytes - size1_bytes,
-                "percent": calc_percent_diff(size1_bytes, size2_bytes),
-                "description": format_diff_descriptive(size1_bytes, size2_bytes)
-            },
-            "dimensions": {
-                "same": (info1['width'] == info2['width'] and info1['height'] == info2['height']),
-                "width_diff": info2['width'] - info1['width'],
-                "height_diff": info2['height'] - info1['height']
-            },
-            "frames": {
-                "diff": info2['frames'] - info1['frames'],
-                "same": info1['frames'] == info2['frames']
-            },
-            "duration": {
-                "diff": info2['duration'] - info1['duration'],
-                "percent": calc_percent_diff(info1['duration'], info2['duration']),
-                "description": format_diff_descriptive(info1['duration'], info2['duration'])
-            },
-            "fps": {
-                "diff": info2['fps'] - info1['fps'],
-                "same": abs(info2['fps'] - info1['fps']) < 0.01
-            },
-            "colors": {
-                "diff": info2['colors'] - info1['colors'],
-                "same": info1['colors'] == info2['colors']
-            }
-        }
-    }
+    # File sizes come from the stat each asset took on construction
+    summary1 = _asset_summary(asset1_path, asset1.size_bytes, info1)
+    summary2 = _asset_summary(asset2_path, asset2.size_bytes, info2)
     
-    return comparison
+    return {
+        "asset1": summary1,
+        "asset2": summary2,
+        "differences": {key: build(summary1, summary2, key) for key, build in _DIFFERENCES},
+    }
+
+
+# Divider lines of the comparison report
+_TITLE_RULE = "=" * 70
+_TABLE_RULE = "-" * 90
 
 
 def print_comparison(comparison: Dict[str, Any]):
@@ -139,40 +133,43 @@ def print_comparison(comparison: Dict[str, Any]):
     asset2 = comparison['asset2']
     diffs = comparison['differences']
     
-    print("\n" + "=" * 70)
-    print("📊 Asset Comparison")
-    print("=" * 70)
+    # Collect the report and write it with a single call
+    lines: List[str] = [
+        "\n" + _TITLE_RULE,
+        "📊 Asset Comparison",
+        _TITLE_RULE,
+    ]
     
-    print(f"\n📁 Asset 1: {asset1['path']}")
-    print(f"📁 Asset 2: {asset2['path']}")
+    lines.append(f"\n📁 Asset 1: {asset1['path']}")
+    lines.append(f"📁 Asset 2: {asset2['path']}")
     
-    print("\n" + "-" * 90)
-    print(f"{'Property':<20} {'Asset 1':<20} {'Asset 2':<20} {'Difference':<25}")
-    print("-" * 90)
+    lines.append("\n" + _TABLE_RULE)
+    lines.append(f"{'Property':<20} {'Asset 1':<20} {'Asset 2':<20} {'Difference':<25}")
+    lines.append(_TABLE_RULE)
     
     # File size
     diff_size = diffs['size_mb']['description']
-    print(f"{'File Size (MB)':<20} {asset1['size_mb']:<20.2f} {asset2['size_mb']:<20.2f} {diff_size:<25}")
-    print(f"{'File Size (bytes)':<20} {asset1['size_bytes']:<20,} {asset2['size_bytes']:<20,} {diffs['size_bytes']['description']:<25}")
+    lines.append(f"{'File Size (MB)':<20} {asset1['size_mb']:<20.2f} {asset2['size_mb']:<20.2f} {diff_size:<25}")
+    lines.append(f"{'File Size (bytes)':<20} {asset1['size_bytes']:<20,} {asset2['size_bytes']:<20,} {diffs['size_bytes']['description']:<25}")
     
     # Dimensions
     dim1 = f"{asset1['width']} × {asset1['height']}"
     dim2 = f"{asset2['width']} × {asset2['height']}"
     dim_diff = "Same" if diffs['dimensions']['same'] else "Different"
-    print(f"{'Dimensions':<20} {dim1:<20} {dim2:<20} {dim_diff:<10}")
+    lines.append(f"{'Dimensions':<20} {dim1:<20} {dim2:<20} {dim_diff:<10}")
     
     # Frame count
     frames1 = asset1['frames']
     frames2 = asset2['frames']
     frames_diff = diffs['frames']['diff']
     frames_diff_str = f"{frames_diff:+d}" if frames_diff != 0 else "0"
-    print(f"{'Frames':<20} {frames1:<20} {frames2:<20} {frames_diff_str:<10}")
+    lines.append(f"{'Frames':<20} {frames1:<20} {frames2:<20} {frames_diff_str:<10}")
     
     # Duration
     dur1 = asset1['duration']
     dur2 = asset2['duration']
     dur_diff = diffs['duration']['description']
-    print(f"{'Duration (sec)':<20} {dur1:<20.2f} {dur2:<20.2f} {dur_diff:<25}")
+    lines.append(f"{'Duration (sec)':<20} {dur1:<20.2f} {dur2:<20.2f} {dur_diff:<25}")
     
     # FPS
     fps1 = asset1['fps']
@@ -184,7 +181,7 @@ def print_comparison(comparison: Dict[str, Any]):
         fps_diff_str = f"+{fps_diff:.2f} (higher)"
     else:
         fps_diff_str = f"{fps_diff:.2f} (lower)"
-    print(f"{'FPS':<20} {fps1:<20.2f} {fps2:<20.2f} {fps_diff_str:<25}")
+    lines.append(f"{'FPS':<20} {fps1:<20.2f} {fps2:<20.2f} {fps_diff_str:<25}")
     
     # Colors
     colors1 = asset1['colors']
@@ -196,18 +193,20 @@ def print_comparison(comparison: Dict[str, Any]):
         colors_diff_str = f"+{colors_diff} (more)"
     else:
         colors_diff_str = f"{colors_diff} (fewer)"
-    print(f"{'Colors (approx)':<20} {colors1:<20} {colors2:<20} {colors_diff_str:<25}")
+    lines.append(f"{'Colors (approx)':<20} {colors1:<20} {colors2:<20} {colors_diff_str:<25}")
     
-    print("-" * 90)
+    lines.append(_TABLE_RULE)
     
     # Summary
     size_saved = asset1['size_mb'] - asset2['size_mb']
     size_saved_pct = diffs['size_mb']['percent']
     if isinstance(size_saved_pct, (int, float)):
         if size_saved_pct < 0:
-            print(f"\n✅ Asset 2 is {abs(size_saved_pct):.1f}% smaller ({abs(size_saved):.2f} MB saved)")
+            lines.append(f"\n✅ Asset 2 is {abs(size_saved_pct):.1f}% smaller ({abs(size_saved):.2f} MB saved)")
         elif size_saved_pct > 0:
-            print(f"\n⚠️  Asset 2 is {abs(size_saved_pct):.1f}% larger ({abs(size_saved):.2f} MB more)")
+            lines.append(f"\n⚠️  Asset 2 is {abs(size_saved_pct):.1f}% larger ({abs(size_saved):.2f} MB more)")
         else:
-            print(f"\n📊 Both assets have the same file size")
-    print()
+            lines.append(f"\n📊 Both assets have the same file size")
+    lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
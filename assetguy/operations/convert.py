@@ -4,11 +4,12 @@ import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from ..assets.video import VideoAsset
-from ..tools.detector import get_imagemagick_command, check_ffmpeg
+from ..tools.detector import check_ffmpeg
 from ..tools.executor import run
+from ..utils.cache import get_meta_cache
 from ..utils.formatting import format_file_size
 
 
@@ -16,7 +17,8 @@ def format_conversion_result(
     input_path: Path,
     output_path: Path,
     input_size: int,
-    output_size: int
+    output_size: int,
+    skipped: bool = False
 ) -> Dict[str, Any]:
     """Format conversion result with file size comparison.
     
@@ -25,6 +27,7 @@ def format_conversion_result(
         output_path: Path to output file
         input_size: Input file size in bytes
         output_size: Output file size in bytes
+        skipped: True if output_path was already up to date and left as is
     
     Returns:
         Dictionary with conversion results
@@ -41,7 +44,8 @@ def format_conversion_result(
         'output_size_formatted': format_file_size(output_size),
         'reduction': reduction,
         'reduction_formatted': format_file_size(reduction),
-        'reduction_percent': reduction_percent
+        'reduction_percent': reduction_percent,
+        'skipped': skipped
     }
 
 
@@ -52,7 +56,7 @@ def print_conversion_result(result: Dict[str, Any]):
         result: Result dictionary from format_conversion_result()
     """
     print("\n" + "=" * 60)
-    print("✅ Conversion Complete")
+    print("✅ Already Up To Date" if result.get('skipped') else "✅ Conversion Complete")
     print("=" * 60)
     print(f"Input:  {result['input_path']}")
     print(f"        {result['input_size_formatted']} ({result['input_size']:,} bytes)")
@@ -65,6 +69,115 @@ def print_conversion_result(result: Dict[str, Any]):
     print("=" * 60 + "\n")
 
 
+# FFmpeg's palettegen accepts max_colors in this range only
+MIN_GIF_COLORS = 4
+MAX_GIF_COLORS = 256
+
+
+def gif_filter_args(
+    width: Optional[int] = None,
+    fps: Optional[float] = None,
+    colors: Optional[int] = None
+) -> List[str]:
+    """Build the FFmpeg filter arguments for a video to GIF conversion.
+    
+    Args:
+        width: Optional target width in pixels
+        fps: Optional target FPS
+        colors: Optional number of colors (MIN_GIF_COLORS to MAX_GIF_COLORS)
+    
+    Returns:
+        FFmpeg arguments ("-vf ..." or "-filter_complex ..."), empty if no
+        filter is needed
+    
+    Raises:
+        ValueError: If colors is outside the range palettegen supports
+    """
+    vf_parts = []
+    
+    # Set FPS if specified
+    if fps:
+        vf_parts.append(f"fps={fps}")
+    
+    # Resize if specified
+    if width:
+        vf_parts.append(f"scale={width}:-1")
+    
+    if colors:
+        if not MIN_GIF_COLORS <= colors <= MAX_GIF_COLORS:
+            raise ValueError(
+                f"Number of colors must be between {MIN_GIF_COLORS} and {MAX_GIF_COLORS} "
+                f"for video to GIF conversion. Got: {colors}"
+            )
+        # Reduce colors in the same FFmpeg pass: build a palette of at most
+        # `colors` entries from the fps/scale output and map frames onto it
+        prefix = ",".join(vf_parts + ["split[s0][s1]"])
+        return [
+            "-filter_complex",
+            f"[0:v]{prefix};"
+            f"[s0]palettegen=max_colors={colors}:stats_mode=diff[p];"
+            "[s1][p]paletteuse=dither=bayer:bayer_scale=5"
+        ]
+    if vf_parts:
+        return ["-vf", ",".join(vf_parts)]
+    return []
+
+
+# MetaCache kind of the record describing how an output file was converted
+_CONVERSION_KIND = "conversion"
+
+
+def _conversion_record(video_asset: VideoAsset, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe a conversion: the input file as of its stat, and the parameters.
+    
+    Args:
+        video_asset: VideoAsset instance of the input
+        params: JSON-serializable conversion parameters
+    
+    Returns:
+        Dictionary stored in the MetaCache entry of the output file
+    """
+    st = video_asset.stat
+    return {
+        "input": os.path.abspath(video_asset.path),
+        "input_mtime": st.st_mtime_ns,
+        "input_size": st.st_size,
+        "params": params,
+    }
+
+
+def _up_to_date_result(
+    video_asset: VideoAsset,
+    output_path: Path,
+    record: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Get the conversion result for an output that is already up to date.
+    
+    An output is up to date if the MetaCache entry stored for it (valid only
+    while the output's mtime and size are unchanged) matches record, i.e. it
+    was written from the unchanged input with the same parameters. Outputs
+    without such an entry, e.g. written by other tools, are never skipped.
+    
+    Args:
+        video_asset: VideoAsset instance of the input
+        output_path: Path the conversion would write
+        record: Conversion record (from _conversion_record)
+    
+    Returns:
+        Result dictionary (from format_conversion_result, with skipped=True)
+        if output_path is up to date, None otherwise
+    """
+    try:
+        output_stat = output_path.stat()
+    except FileNotFoundError:
+        return None
+    if get_meta_cache().get(output_path, _CONVERSION_KIND, output_stat) != record:
+        return None
+    return format_conversion_result(
+        video_asset.path, output_path, video_asset.size_bytes, output_stat.st_size, skipped=True
+    )
+
+
 def convert_video_to_gif(
     video_asset: VideoAsset,
     output_path: Optional[Path] = None,
@@ -72,7 +185,8 @@ def convert_video_to_gif(
     fps: Optional[float] = None,
     colors: Optional[int] = None,
     start_time: Optional[float] = None,
-    end_time: Optional[float] = None
+    end_time: Optional[float] = None,
+    force: bool = False
 ) -> Dict[str, Any]:
     """Convert a video file to GIF format.
     
@@ -81,25 +195,23 @@ def convert_video_to_gif(
         output_path: Optional output path (default: generate from input)
         width: Optional target width in pixels
         fps: Optional target FPS
-        colors: Optional number of colors for optimization
+        colors: Optional number of colors for optimization (4-256)
         start_time: Optional start time in seconds (for trimming)
         end_time: Optional end time in seconds (for trimming)
+        force: Convert even if output_path is already up to date
     
     Returns:
-        Dictionary with conversion results (from format_conversion_result)
+        Dictionary with conversion results (from format_conversion_result).
+        An output written by an earlier conversion of the unchanged input with
+        the same parameters is left as is and reported with 'skipped' True,
+        without running FFmpeg.
     
     Raises:
-        RuntimeError: If FFmpeg or ImageMagick not found
+        RuntimeError: If FFmpeg not found
         ValueError: If video info cannot be read or parameters are invalid
     """
-    # Check FFmpeg availability
-    ffmpeg_available, _ = check_ffmpeg()
-    if not ffmpeg_available:
-        raise RuntimeError("FFmpeg not found. Please install FFmpeg first.")
-    
-    info = video_asset.get_info()
-    if not info:
-        raise ValueError("Could not read video information")
+    # Reject an unsupported number of colors before doing any work
+    filter_args = gif_filter_args(width=width, fps=fps, colors=colors)
     
     input_path = video_asset.path
     input_size = video_asset.size_bytes
@@ -109,6 +221,25 @@ def convert_video_to_gif(
         stem = input_path.stem
         output_path = input_path.parent / f"{stem}.gif"
     
+    # Skip the conversion when the output already matches input and parameters
+    record = _conversion_record(video_asset, {
+        "format": "gif", "width": width, "fps": fps, "colors": colors,
+        "start_time": start_time, "end_time": end_time,
+    })
+    if not force:
+        result = _up_to_date_result(video_asset, output_path, record)
+        if result is not None:
+            return result
+    
+    # Check FFmpeg availability
+    ffmpeg_available, _ = check_ffmpeg()
+    if not ffmpeg_available:
+        raise RuntimeError("FFmpeg not found. Please install FFmpeg first.")
+    
+    info = video_asset.get_info()
+    if not info:
+        raise ValueError("Could not read video information")
+    
     # Validate time range
     duration = info['duration']
     if start_time is not None and start_time < 0:
@@ -126,8 +257,9 @@ def convert_video_to_gif(
     else:
         convert_duration = duration
     
-    # Use temp file for initial conversion
-    temp_fd, temp_file = tempfile.mkstemp(suffix='.gif', prefix='video_convert_')
+    # Use temp file for initial conversion, next to the output so the final
+    # os.replace() is an atomic rename rather than a cross-filesystem copy
+    temp_fd, temp_file = tempfile.mkstemp(suffix='.gif', prefix='video_convert_', dir=str(output_path.parent))
     os.close(temp_fd)
     
     try:
@@ -147,20 +279,8 @@ def convert_video_to_gif(
         if start_time is not None or end_time is not None:
             ffmpeg_cmd.extend(["-t", str(convert_duration)])
         
-        # Build video filter
-        vf_parts = []
-        
-        # Set FPS if specified
-        if fps:
-            vf_parts.append(f"fps={fps}")
-        
-        # Resize if specified
-        if width:
-            vf_parts.append(f"scale={width}:-1")
-        
-        # Combine video filters
-        if vf_parts:
-            ffmpeg_cmd.extend(["-vf", ",".join(vf_parts)])
+        # Frame rate, size and palette filters
+        ffmpeg_cmd.extend(filter_args)
         
         # Output to temp file
         ffmpeg_cmd.append(temp_file)
@@ -168,63 +288,27 @@ def convert_video_to_gif(
         # Run FFmpeg conversion (suppress verbose output)
         run(ffmpeg_cmd, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
         
-        # Apply color reduction if specified
-        if colors:
-            magick_cmd = get_imagemagick_command()
-            if not magick_cmd:
-                # If ImageMagick not available, just use the temp file as output
-                if os.path.exists(temp_file):
-                    os.rename(temp_file, output_path)
-                else:
-                    raise RuntimeError("FFmpeg conversion failed: output file not created")
-            else:
-                # Use ImageMagick to reduce colors
-                final_fd, final_file = tempfile.mkstemp(suffix='.gif', prefix='gif_colors_')
-                os.close(final_fd)
-                
-                try:
-                    color_cmd = [magick_cmd, temp_file, "-colors", str(colors), final_file]
-                    run(color_cmd)
-                    
-                    # Move final file to output path
-                    if os.path.exists(final_file):
-                        os.rename(final_file, output_path)
-                    else:
-                        raise RuntimeError("Color reduction failed: output file not created")
-                except Exception as e:
-                    # If color reduction fails, use the temp file
-                    if os.path.exists(temp_file):
-                        os.rename(temp_file, output_path)
-                    else:
-                        raise
-                finally:
-                    # Clean up temp files
-                    if os.path.exists(final_file):
-                        try:
-                            os.remove(final_file)
-                        except:
-                            pass
-        else:
-            # No color reduction, just move temp file to output
-            if os.path.exists(temp_file):
-                os.rename(temp_file, output_path)
-            else:
-                raise RuntimeError("FFmpeg conversion failed: output file not created")
+        # Move temp file to output
+        try:
+            os.replace(temp_file, output_path)
+        except FileNotFoundError:
+            raise RuntimeError("FFmpeg conversion failed: output file not created")
         
-        # Get output file size
-        output_size = output_path.stat().st_size
+        # Get output file size, and remember how the output was made
+        output_stat = output_path.stat()
+        output_size = output_stat.st_size
+        get_meta_cache().put(output_path, _CONVERSION_KIND, record, output_stat)
         
         # Format and return result
         result = format_conversion_result(input_path, output_path, input_size, output_size)
         return result
         
-    except Exception as e:
-        # Clean up temp file on error
-        if os.path.exists(temp_file):
-            try:
-                os.remove(temp_file)
-            except:
-                pass
+    except BaseException:
+        # Clean up temp file on error, including Ctrl+C
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
         raise
 
 
@@ -235,7 +319,8 @@ def convert_video_to_webp(
     fps: Optional[float] = None,
     quality: Optional[int] = None,
     start_time: Optional[float] = None,
-    end_time: Optional[float] = None
+    end_time: Optional[float] = None,
+    force: bool = False
 ) -> Dict[str, Any]:
     """Convert a video file to WebP animation format.
     
@@ -247,14 +332,42 @@ def convert_video_to_webp(
         quality: Optional quality setting (0-100, default: 85)
         start_time: Optional start time in seconds (for trimming)
         end_time: Optional end time in seconds (for trimming)
+        force: Convert even if output_path is already up to date
     
     Returns:
-        Dictionary with conversion results (from format_conversion_result)
+        Dictionary with conversion results (from format_conversion_result).
+        An output written by an earlier conversion of the unchanged input with
+        the same parameters is left as is and reported with 'skipped' True,
+        without running FFmpeg.
     
     Raises:
         RuntimeError: If FFmpeg not found
         ValueError: If video info cannot be read or parameters are invalid
     """
+    input_path = video_asset.path
+    input_size = video_asset.size_bytes
+    
+    # Generate output path if not provided
+    if output_path is None:
+        stem = input_path.stem
+        output_path = input_path.parent / f"{stem}.webp"
+    
+    # Validate quality
+    if quality is None:
+        quality = 85  # Default quality
+    else:
+        quality = max(0, min(100, quality))  # Clamp to 0-100
+    
+    # Skip the conversion when the output already matches input and parameters
+    record = _conversion_record(video_asset, {
+        "format": "webp", "width": width, "fps": fps, "quality": quality,
+        "start_time": start_time, "end_time": end_time,
+    })
+    if not force:
+        result = _up_to_date_result(video_asset, output_path, record)
+        if result is not None:
+            return result
+    
     # Check FFmpeg availability
     ffmpeg_available, _ = check_ffmpeg()
     if not ffmpeg_available:
@@ -264,14 +377,6 @@ def convert_video_to_webp(
     if not info:
         raise ValueError("Could not read video information")
     
-    input_path = video_asset.path
-    input_size = video_asset.size_bytes
-    
-    # Generate output path if not provided
-    if output_path is None:
-        stem = input_path.stem
-        output_path = input_path.parent / f"{stem}.webp"
-    
     # Validate time range
     duration = info['duration']
     if start_time is not None and start_time < 0:
@@ -289,14 +394,9 @@ def convert_video_to_webp(
     else:
         convert_duration = duration
     
-    # Validate quality
-    if quality is None:
-        quality = 85  # Default quality
-    else:
-        quality = max(0, min(100, quality))  # Clamp to 0-100
-    
-    # Use temp file for conversion
-    temp_fd, temp_file = tempfile.mkstemp(suffix='.webp', prefix='video_convert_')
+    # Use temp file for conversion, next to the output so the final
+    # os.replace() is an atomic rename rather than a cross-filesystem copy
+    temp_fd, temp_file = tempfile.mkstemp(suffix='.webp', prefix='video_convert_', dir=str(output_path.parent))
     os.close(temp_fd)
     
     try:
@@ -341,23 +441,24 @@ def convert_video_to_webp(
         run(ffmpeg_cmd, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
         
         # Move temp file to output path
-        if os.path.exists(temp_file):
-            os.rename(temp_file, output_path)
-        else:
+        try:
+            os.replace(temp_file, output_path)
+        except FileNotFoundError:
             raise RuntimeError("FFmpeg conversion failed: output file not created")
         
-        # Get output file size
-        output_size = output_path.stat().st_size
+        # Get output file size, and remember how the output was made
+        output_stat = output_path.stat()
+        output_size = output_stat.st_size
+        get_meta_cache().put(output_path, _CONVERSION_KIND, record, output_stat)
         
         # Format and return result
         result = format_conversion_result(input_path, output_path, input_size, output_size)
         return result
         
-    except Exception as e:
-        # Clean up temp file on error
-        if os.path.exists(temp_file):
-            try:
-                os.remove(temp_file)
-            except:
-                pass
+    except BaseException:
+        # Clean up temp file on error, including Ctrl+C
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
         raise
@@ -1,16 +1,31 @@
 """Unified asset inspection operations."""
 
 import json
+import os
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 
+from ..assets.base import Asset, AssetNotFoundError
 from ..assets.gif import GifAsset
 from ..assets.image import ImageAsset
 from ..assets.video import VideoAsset
+from ..utils.cache import get_meta_cache
 from ..utils.formatting import format_file_size
 
 
+_VIDEO_FORMATS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'})
+
+# Lowercase suffix -> asset type; '.gif' is listed last so it wins over 'image'
+_EXT_TO_TYPE: Dict[str, str] = {
+    **{ext: 'video' for ext in _VIDEO_FORMATS},
+    **{ext: 'image' for ext in ImageAsset.SUPPORTED_FORMATS},
+    '.gif': 'gif',
+}
+
+
 def detect_asset_type(path: Path) -> Optional[str]:
     """Detect asset type from file path.
     
@@ -20,36 +35,49 @@ def detect_asset_type(path: Path) -> Optional[str]:
     Returns:
         Asset type ('gif', 'image', 'video') or None if unknown
     """
-    suffix = path.suffix.lower()
-    
-    if suffix == '.gif':
-        return 'gif'
-    elif suffix in ImageAsset.SUPPORTED_FORMATS:
-        return 'image'
-    elif suffix in {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'}:
-        return 'video'
+    return _EXT_TO_TYPE.get(path.suffix.lower())
+
+
+def _common_fields(asset_type: str, path: Path, size_bytes: int) -> Dict[str, Any]:
+    """Build the fields shared by every inspection result.
     
-    return None
+    Args:
+        asset_type: Asset type ('gif', 'image', 'video')
+        path: Path to asset file
+        size_bytes: File size in bytes
+        
+    Returns:
+        Dictionary with type, path and size fields
+    """
+    return {
+        'type': asset_type,
+        'path': str(path),
+        'size_bytes': size_bytes,
+        'size_formatted': format_file_size(size_bytes),
+    }
 
 
-def inspect_asset(path: Path) -> Dict[str, Any]:
+def inspect_asset(path: Path, asset: Optional[Asset] = None) -> Dict[str, Any]:
     """Inspect an asset and return its information.
     
     Args:
         path: Path to asset file
+        asset: Optional asset already loaded for path, of the class matching
+            its type (GifAsset, ImageAsset or VideoAsset). Its cached metadata
+            is reused instead of loading the file again.
         
     Returns:
         Dictionary containing asset information
     """
     path = Path(path)
     
-    if not path.exists():
-        raise FileNotFoundError(f"Asset not found: {path}")
-    
+    # A missing file is reported by the asset constructor (AssetNotFoundError),
+    # or below for unknown types
     asset_type = detect_asset_type(path)
     
     if asset_type == 'gif':
-        asset = GifAsset(path)
+        if asset is None:
+            asset = GifAsset(path)
         info = asset.get_info()
         if not info:
             # Check if ImageMagick is available
@@ -71,23 +99,31 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
                     "The file may be corrupted or in an unsupported format."
                 )
         
-        return {
-            'type': 'gif',
-            'path': str(path),
-            'size_bytes': asset.size_bytes,
-            'size_formatted': format_file_size(asset.size_bytes),
+        result = _common_fields('gif', path, asset.size_bytes)
+        result.update({
             'width': info['width'],
             'height': info['height'],
             'frames': info['frames'],
             'fps': info['fps'],
             'duration': info['duration'],
             'colors': info['colors'],
-        }
+        })
+        return result
     
     elif asset_type == 'image':
-        asset = ImageAsset(path)
+        if asset is None:
+            asset = ImageAsset(path)
         info = asset.get_info()
         
+        # Every image result starts from the same static fields
+        result = _common_fields('image', path, asset.size_bytes)
+        result.update({
+            'width': info['width'],
+            'height': info['height'],
+            'format': info['format'],
+            'mode': info['mode'],
+        })
+        
         # Check if this is an animated WebP
         if path.suffix.lower() == '.webp' and asset.is_animated_webp():
             # Use ffprobe to get animation metadata
@@ -96,18 +132,11 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
             
             if not ffmpeg_available:
                 # Fallback to basic image info if FFmpeg not available
-                return {
-                    'type': 'image',
-                    'path': str(path),
-                    'size_bytes': asset.size_bytes,
-                    'size_formatted': format_file_size(asset.size_bytes),
-                    'width': info['width'],
-                    'height': info['height'],
-                    'format': info['format'],
-                    'mode': info['mode'],
+                result.update({
                     'is_animated': True,
                     'note': 'FFmpeg required for full animated WebP metadata'
-                }
+                })
+                return result
             
             # Get animated WebP metadata using ffprobe and PIL
             try:
@@ -123,10 +152,11 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
                             break  # Reached end of frames
                 
                 # Try to get FPS and duration from ffprobe
-                result = subprocess.run(
+                probe = subprocess.run(
                     [
                         "ffprobe",
                         "-v", "quiet",
+                        "-select_streams", "v:0",
                         "-print_format", "json",
                         "-show_format",
                         "-show_streams",
@@ -137,7 +167,7 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
                     check=True
                 )
                 
-                data = json.loads(result.stdout)
+                data = json.loads(probe.stdout)
                 
                 # Find video stream
                 video_stream = None
@@ -176,47 +206,23 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
                     if frame_count == 0 and fps > 0 and duration > 0:
                         frame_count = int(fps * duration)
                 
-                return {
-                    'type': 'image',
-                    'path': str(path),
-                    'size_bytes': asset.size_bytes,
-                    'size_formatted': format_file_size(asset.size_bytes),
-                    'width': info['width'],
-                    'height': info['height'],
-                    'format': info['format'],
-                    'mode': info['mode'],
+                result.update({
                     'is_animated': True,
                     'frames': frame_count,
                     'fps': fps,
                     'duration': duration,
-                }
+                })
+                return result
             except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError):
                 # If ffprobe fails, return basic info with animation flag
-                return {
-                    'type': 'image',
-                    'path': str(path),
-                    'size_bytes': asset.size_bytes,
-                    'size_formatted': format_file_size(asset.size_bytes),
-                    'width': info['width'],
-                    'height': info['height'],
-                    'format': info['format'],
-                    'mode': info['mode'],
-                    'is_animated': True,
-                }
+                result['is_animated'] = True
+                return result
         
-        return {
-            'type': 'image',
-            'path': str(path),
-            'size_bytes': asset.size_bytes,
-            'size_formatted': format_file_size(asset.size_bytes),
-            'width': info['width'],
-            'height': info['height'],
-            'format': info['format'],
-            'mode': info['mode'],
-        }
+        return result
     
     elif asset_type == 'video':
-        asset = VideoAsset(path)
+        if asset is None:
+            asset = VideoAsset(path)
         info = asset.get_info()
         if not info:
             # Check if FFmpeg is available
@@ -238,11 +244,8 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
                     "The file may be corrupted or in an unsupported format."
                 )
         
-        return {
-            'type': 'video',
-            'path': str(path),
-            'size_bytes': asset.size_bytes,
-            'size_formatted': format_file_size(asset.size_bytes),
+        result = _common_fields('video', path, asset.size_bytes)
+        result.update({
             'width': info['width'],
             'height': info['height'],
             'duration': info['duration'],
@@ -250,53 +253,140 @@ def inspect_asset(path: Path) -> Dict[str, Any]:
             'codec': info['codec'],
             'bitrate_kbps': info['bitrate_kbps'],
             'frame_count': info['frame_count'],
-        }
+        })
+        return result
     
     else:
+        # No asset constructor stats the path here; report a missing file
+        # as such rather than as an unsupported type
+        if not os.path.lexists(path):
+            raise AssetNotFoundError(path)
         raise ValueError(f"Unknown or unsupported asset type: {path.suffix}")
 
 
+def inspect_asset_cached(
+    path: Path,
+    st: Optional[os.stat_result] = None,
+    asset: Optional[Asset] = None
+) -> Dict[str, Any]:
+    """Inspect an asset, reusing a previous result for an unchanged file.
+    
+    Results are stored in the metadata cache keyed by path, mtime and size.
+    Partial results (animated WebP inspected without FFmpeg) are not cached
+    so they are recomputed once FFmpeg becomes available.
+    
+    Args:
+        path: Path to asset file
+        st: Optional stat result the caller already has for path (e.g.
+            Asset.stat), saving another stat call
+        asset: Optional asset already loaded for path; its stat is used when
+            st is not given, and on a cache miss it is passed to inspect_asset()
+        
+    Returns:
+        Dictionary containing asset information
+    """
+    path = Path(path)
+    if st is None and asset is not None:
+        st = asset.stat
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Let inspect_asset report the missing file
+            return inspect_asset(path)
+    
+    cache = get_meta_cache()
+    info = cache.get(path, 'inspect', st)
+    if info is not None:
+        # The cache is keyed by absolute path; report the path as given
+        info['path'] = str(path)
+        return info
+    
+    info = inspect_asset(path, asset)
+    if not (info.get('is_animated') and 'frames' not in info):
+        cache.put(path, 'inspect', info, st)
+    return info
+
+
+def inspect_assets(paths: Iterable[Path], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Inspect several assets concurrently.
+    
+    Each file goes through inspect_asset_cached(); the work is dominated by
+    file reads and ffprobe/ImageMagick subprocesses, so the files are
+    inspected on a thread pool.
+    
+    Args:
+        paths: Paths to asset files
+        max_workers: Optional number of worker threads (default: up to 8,
+            bounded by the CPU count)
+        
+    Returns:
+        List of inspection dictionaries, in the same order as paths
+    
+    Raises:
+        FileNotFoundError: If a file does not exist
+        ValueError: If a file's type is unsupported or its metadata cannot be read
+            (the first failing file in input order is reported)
+    """
+    paths = [Path(path) for path in paths]
+    if len(paths) <= 1:
+        return [inspect_asset_cached(path) for path in paths]
+    
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(inspect_asset_cached, paths))
+
+
+# Divider line of the inspection report
+_RULE = "=" * 60
+
+
 def print_inspection(info: Dict[str, Any]):
     """Print formatted asset inspection information.
     
     Args:
         info: Inspection dictionary from inspect_asset()
     """
-    print("\n" + "=" * 60)
-    print(f"📊 Asset Information: {info['path']}")
-    print("=" * 60)
+    # Collect the report and write it with a single call
+    lines: List[str] = [
+        "\n" + _RULE,
+        f"📊 Asset Information: {info['path']}",
+        _RULE,
+    ]
     
-    print(f"Type: {info['type'].upper()}")
-    print(f"File Size: {info['size_formatted']} ({info['size_bytes']:,} bytes)")
+    lines.append(f"Type: {info['type'].upper()}")
+    lines.append(f"File Size: {info['size_formatted']} ({info['size_bytes']:,} bytes)")
     
     if info['type'] == 'gif':
-        print(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
-        print(f"Frames: {info['frames']}")
-        print(f"FPS: {info['fps']:.2f}")
-        print(f"Duration: {info['duration']:.2f} seconds")
-        print(f"Colors (approx): {info['colors']}")
+        lines.append(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
+        lines.append(f"Frames: {info['frames']}")
+        lines.append(f"FPS: {info['fps']:.2f}")
+        lines.append(f"Duration: {info['duration']:.2f} seconds")
+        lines.append(f"Colors (approx): {info['colors']}")
     
     elif info['type'] == 'image':
-        print(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
-        print(f"Format: {info['format']}")
-        print(f"Mode: {info['mode']}")
+        lines.append(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
+        lines.append(f"Format: {info['format']}")
+        lines.append(f"Mode: {info['mode']}")
         if info.get('is_animated'):
-            print(f"Animated: Yes")
+            lines.append(f"Animated: Yes")
             if 'frames' in info:
-                print(f"Frames: {info['frames']}")
+                lines.append(f"Frames: {info['frames']}")
             if 'fps' in info:
-                print(f"FPS: {info['fps']:.2f}")
+                lines.append(f"FPS: {info['fps']:.2f}")
             if 'duration' in info:
-                print(f"Duration: {info['duration']:.2f} seconds")
+                lines.append(f"Duration: {info['duration']:.2f} seconds")
             if 'note' in info:
-                print(f"Note: {info['note']}")
+                lines.append(f"Note: {info['note']}")
     
     elif info['type'] == 'video':
-        print(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
-        print(f"Duration: {info['duration']:.2f} seconds")
-        print(f"FPS: {info['fps']:.2f}")
-        print(f"Codec: {info['codec']}")
-        print(f"Bitrate: {info['bitrate_kbps']:.0f} kbps")
-        print(f"Frames: {info['frame_count']}")
+        lines.append(f"Dimensions (Width × Height): {info['width']} × {info['height']} px")
+        lines.append(f"Duration: {info['duration']:.2f} seconds")
+        lines.append(f"FPS: {info['fps']:.2f}")
+        lines.append(f"Codec: {info['codec']}")
+        lines.append(f"Bitrate: {info['bitrate_kbps']:.0f} kbps")
+        lines.append(f"Frames: {info['frame_count']}")
+    
+    lines.append(_RULE + "\n")
     
-    print("=" * 60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -3,6 +3,7 @@
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 
@@ -123,6 +124,37 @@ def parse_split_times(input_str: str, max_duration: float) -> Optional[List[floa
         return None
 
 
+def parse_ranges(input_str: str, max_value: float, is_frame: bool = False) -> List[Tuple[Any, Any]]:
+    """Parse comma-separated ranges (e.g., "0-2.5, 3.5-4.5") in a single pass.
+    
+    Each range is validated with parse_frame_range() or parse_time_range();
+    empty or invalid ranges are skipped.
+    
+    Args:
+        input_str: Input string with comma-separated "start-end" ranges
+        max_value: Maximum frame count or duration in seconds (for validation)
+        is_frame: True to parse frame ranges, False for time ranges
+    
+    Returns:
+        List of valid (start, end) tuples, in input order
+    """
+    parse_range = parse_frame_range if is_frame else parse_time_range
+    ranges = []
+    end = len(input_str)
+    pos = 0
+    while pos <= end:
+        comma = input_str.find(',', pos)
+        if comma < 0:
+            comma = end
+        part = input_str[pos:comma].strip()
+        if part:
+            range_tuple = parse_range(part, max_value)
+            if range_tuple:
+                ranges.append(range_tuple)
+        pos = comma + 1
+    return ranges
+
+
 def parse_split_trim_input(
     input_str: str,
     max_duration: float,
@@ -164,19 +196,7 @@ def parse_split_trim_input(
     # Check for trim mode (contains '-')
     if '-' in input_str:
         # Parse multiple ranges if comma-separated
-        parts = [p.strip() for p in input_str.split(',') if p.strip()]
-        ranges = []
-        
-        for part in parts:
-            if '-' in part:
-                # Parse as range
-                if is_frame:
-                    range_tuple = parse_frame_range(part, max_frames)
-                else:
-                    range_tuple = parse_time_range(part, max_duration)
-                
-                if range_tuple:
-                    ranges.append(range_tuple)
+        ranges = parse_ranges(input_str, max_frames if is_frame else max_duration, is_frame)
         
         if ranges:
             return {
@@ -332,20 +352,14 @@ def split_gif(
         coalesce_fd, coalesce_file = tempfile.mkstemp(suffix='.gif', prefix='gif_coalesce_')
         os.close(coalesce_fd)
         
-        extract_fd, extract_file = tempfile.mkstemp(suffix='.gif', prefix='gif_split_')
-        os.close(extract_fd)
-        
         try:
             # Step 1: Coalesce all frames
             coalesce_cmd = [magick_cmd, str(input_path), "-coalesce", coalesce_file]
             run(coalesce_cmd)
             
-            # Step 2: Extract frame range from coalesced GIF
-            extract_cmd = [magick_cmd, f"{coalesce_file}[{start_frame}-{end_frame}]", extract_file]
-            run(extract_cmd)
-            
-            # Step 3: Build optimization command
-            opt_cmd = [magick_cmd, extract_file]
+            # Step 2: Build optimization command; the frame range is read straight
+            # from the coalesced GIF, so no intermediate extract file is written
+            opt_cmd = [magick_cmd, f"{coalesce_file}[{start_frame}-{end_frame}]"]
             
             # Coalesce again if we need to modify delays (for FPS adjustment)
             if fps:
@@ -386,14 +400,10 @@ def split_gif(
             # Clean up temp files
             if os.path.exists(coalesce_file):
                 os.remove(coalesce_file)
-            if os.path.exists(extract_file):
-                os.remove(extract_file)
         except Exception as e:
             print(f"   ✗ Segment {i+1} failed: {e}")
             if os.path.exists(coalesce_file):
                 os.remove(coalesce_file)
-            if os.path.exists(extract_file):
-                os.remove(extract_file)
             continue
         
         output_files.append(output_path)
@@ -413,7 +423,8 @@ def trim_gif(
     width: Optional[int] = None,
     fps: Optional[float] = None,
     fps_mode: str = "normalize",
-    colors: Optional[int] = None
+    colors: Optional[int] = None,
+    coalesced_path: Optional[Path] = None
 ) -> Dict[str, Any]:
     """Trim a GIF to extract a single range (time-based or frame-based).
     
@@ -428,6 +439,8 @@ def trim_gif(
         fps: Optional target FPS for optimization
         fps_mode: "normalize" (equal delays) or "preserve" (scale delays)
         colors: Optional number of colors for optimization
+        coalesced_path: Optional already coalesced copy of the GIF to extract
+            from (default: coalesce the input into a temp file)
     
     Returns:
         Dictionary with optimization results (from format_optimization_result)
@@ -486,24 +499,24 @@ def trim_gif(
     
     delays = info.get('delays', [])
     
-    # Coalesce before extraction to prevent visual corruption with disposal methods
-    coalesce_fd, coalesce_file = tempfile.mkstemp(suffix='.gif', prefix='gif_coalesce_')
-    os.close(coalesce_fd)
-    
-    extract_fd, extract_file = tempfile.mkstemp(suffix='.gif', prefix='gif_trim_')
-    os.close(extract_fd)
+    # Coalesce before extraction to prevent visual corruption with disposal methods.
+    # A caller-provided coalesced copy is shared and must not be removed here.
+    if coalesced_path is not None:
+        coalesce_file = str(coalesced_path)
+    else:
+        coalesce_fd, coalesce_file = tempfile.mkstemp(suffix='.gif', prefix='gif_coalesce_')
+        os.close(coalesce_fd)
+    owns_coalesce_file = coalesced_path is None
     
     try:
         # Step 1: Coalesce all frames
-        coalesce_cmd = [magick_cmd, str(input_path), "-coalesce", coalesce_file]
-        run(coalesce_cmd)
-        
-        # Step 2: Extract frame range from coalesced GIF
-        extract_cmd = [magick_cmd, f"{coalesce_file}[{start_frame}-{end_frame}]", extract_file]
-        run(extract_cmd)
+        if owns_coalesce_file:
+            coalesce_cmd = [magick_cmd, str(input_path), "-coalesce", coalesce_file]
+            run(coalesce_cmd)
         
-        # Step 3: Build optimization command
-        opt_cmd = [magick_cmd, extract_file]
+        # Step 2: Build optimization command; the frame range is read straight
+        # from the coalesced GIF, so no intermediate extract file is written
+        opt_cmd = [magick_cmd, f"{coalesce_file}[{start_frame}-{end_frame}]"]
         
         # Coalesce again if we need to modify delays (for FPS adjustment)
         if fps:
@@ -542,10 +555,8 @@ def trim_gif(
         run(opt_cmd)
         
         # Clean up temp files
-        if os.path.exists(coalesce_file):
+        if owns_coalesce_file and os.path.exists(coalesce_file):
             os.remove(coalesce_file)
-        if os.path.exists(extract_file):
-            os.remove(extract_file)
         
         # Get output file size
         output_size = output_path.stat().st_size
@@ -556,13 +567,90 @@ def trim_gif(
         
     except Exception as e:
         # Clean up temp files on error
-        if os.path.exists(coalesce_file):
+        if owns_coalesce_file and os.path.exists(coalesce_file):
             os.remove(coalesce_file)
-        if os.path.exists(extract_file):
-            os.remove(extract_file)
         raise
 
 
+def trim_gif_ranges(
+    gif_asset: GifAsset,
+    ranges: List[Tuple[Any, Any]],
+    output_paths: List[Path],
+    is_frame: bool = False,
+    width: Optional[int] = None,
+    fps: Optional[float] = None,
+    fps_mode: str = "normalize",
+    colors: Optional[int] = None
+) -> List[Optional[Exception]]:
+    """Trim several ranges of a GIF concurrently.
+    
+    The input is coalesced once and every range is extracted from that
+    shared copy, so N ranges cost one coalesce instead of N. Each range is
+    then an independent trim_gif() call whose time is spent in ImageMagick
+    subprocesses, so the ranges run on a thread pool.
+    
+    Args:
+        gif_asset: GifAsset instance
+        ranges: (start, end) pairs, in seconds or frame indices
+        output_paths: Output path for each range (see plan_trim_outputs())
+        is_frame: True if ranges are frame indices, False for seconds
+        width: Optional target width for optimization
+        fps: Optional target FPS for optimization
+        fps_mode: "normalize" (equal delays) or "preserve" (scale delays)
+        colors: Optional number of colors for optimization
+    
+    Returns:
+        One entry per range, in input order: None on success, or the
+        exception that made that trim fail
+    """
+    coalesced_path = None
+    
+    def trim_one(job: Tuple[Tuple[Any, Any], Path]) -> Optional[Exception]:
+        (start, end), output_path = job
+        if is_frame:
+            bounds = {'start_frame': start, 'end_frame': end}
+        else:
+            bounds = {'start_time': start, 'end_time': end}
+        try:
+            trim_gif(
+                gif_asset,
+                output_path=output_path,
+                width=width,
+                fps=fps,
+                fps_mode=fps_mode,
+                colors=colors,
+                coalesced_path=coalesced_path,
+                **bounds
+            )
+        except Exception as e:
+            return e
+        return None
+    
+    jobs = list(zip(ranges, output_paths))
+    if len(jobs) <= 1:
+        return [trim_one(job) for job in jobs]
+    
+    magick_cmd = get_imagemagick_command()
+    if not magick_cmd:
+        error = RuntimeError("ImageMagick not found. Please install ImageMagick first.")
+        return [error for _ in jobs]
+    
+    coalesce_fd, coalesce_file = tempfile.mkstemp(suffix='.gif', prefix='gif_coalesce_')
+    os.close(coalesce_fd)
+    try:
+        try:
+            run([magick_cmd, str(gif_asset.path), "-coalesce", coalesce_file])
+        except Exception as e:
+            return [e for _ in jobs]
+        coalesced_path = Path(coalesce_file)
+        
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            return list(pool.map(trim_one, jobs))
+    finally:
+        if os.path.exists(coalesce_file):
+            os.remove(coalesce_file)
+
+
 def generate_output_filename(input_path: Path, suffix: str = "_optimized") -> Path:
     """Generate output filename for optimized asset.
     
@@ -578,6 +666,32 @@ def generate_output_filename(input_path: Path, suffix: str = "_optimized") -> Pa
     return input_path.parent / f"{stem}{suffix}{ext}"
 
 
+def plan_trim_outputs(output_path: Path, count: int, fallback_path: Optional[Path] = None) -> List[Path]:
+    """Compute the output path of each trim range.
+    
+    A single trim writes to output_path itself. Multiple trims get numbered
+    names ("<stem>_trim1<ext>", ...) next to output_path.
+    
+    Args:
+        output_path: Requested output file path
+        count: Number of trim ranges
+        fallback_path: If given and output_path is not an existing file, the
+            numbered names are derived from this path instead
+        
+    Returns:
+        List of output paths, one per trim range
+    """
+    if count == 1:
+        return [output_path]
+    
+    base = output_path
+    if fallback_path is not None and not output_path.is_file():
+        base = fallback_path
+    # Path components are read once; each name is a single format() call
+    parent, template = base.parent, base.stem + "_trim{}" + base.suffix
+    return [parent / template.format(i) for i in range(1, count + 1)]
+
+
 def format_optimization_result(
     input_path: Path,
     output_path: Path,
@@ -628,6 +742,46 @@ def print_optimization_result(result: Dict[str, Any]):
     print("=" * 60 + "\n")
 
 
+def format_outputs_result(
+    operation: str,
+    input_path: Path,
+    output_files: List[Path],
+    sizes: List[int]
+) -> Dict[str, Any]:
+    """Format the result of an operation that wrote several files.
+    
+    Args:
+        operation: Operation name ('split' or 'trim')
+        input_path: Path to input file
+        output_files: Paths of the created files
+        sizes: Size in bytes of each created file (see utils.paths.file_sizes())
+        
+    Returns:
+        Dictionary with the output paths, their count and per-file sizes
+    """
+    outputs = [{'path': str(f), 'size_bytes': size} for f, size in zip(output_files, sizes)]
+    return {
+        'operation': operation,
+        'input_path': str(input_path),
+        'output_files': [output['path'] for output in outputs],
+        'count': len(outputs),
+        'outputs': outputs,
+    }
+
+
+def print_created_files(output_files: List[Path], sizes: List[int], noun: str):
+    """Print a numbered list of created files with their sizes.
+    
+    Args:
+        output_files: Paths of the created files
+        sizes: Size in bytes of each created file
+        noun: What the files are, e.g. "segment(s)"
+    """
+    print(f"\n✅ Created {len(output_files)} {noun}:")
+    for i, (output_file, size) in enumerate(zip(output_files, sizes), 1):
+        print(f"   {i}. {output_file.name} ({format_file_size(size)})")
+
+
 def optimize_gif(
     gif_asset: GifAsset,
     output_path: Optional[Path] = None,
@@ -1,17 +1,33 @@
-"""Tool detection and execution utilities."""
-
-from .detector import (
-    check_command,
-    check_imagemagick,
-    check_ffmpeg,
-    get_imagemagick_command,
-)
-from .executor import run
-
-__all__ = [
-    'check_command',
-    'check_imagemagick',
-    'check_ffmpeg',
-    'get_imagemagick_command',
-    'run',
-]
+"""Tool detection and execution utilities.
+
+Names are resolved lazily on first access, so importing one tool module
+(e.g. ``assetguy.tools.detector``) does not import the others.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'check_command': 'detector',
+    'check_imagemagick': 'detector',
+    'check_ffmpeg': 'detector',
+    'get_imagemagick_command': 'detector',
+    'clear_tool_cache': 'detector',
+    'run': 'executor',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
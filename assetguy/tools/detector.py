@@ -1,7 +1,12 @@
-"""Detect availability of external tools (ImageMagick, FFmpeg, etc.)."""
+"""Detect availability of external tools (ImageMagick, FFmpeg, etc.).
+
+Detection results for ImageMagick and FFmpeg are memoized for the lifetime of
+the process, since each check spawns the tool with a version flag.
+"""
 
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -35,6 +40,7 @@ def check_command(command: str, version_flag: str = "--version") -> Tuple[bool,
     return False, None
 
 
+@lru_cache(maxsize=1)
 def check_imagemagick() -> Tuple[bool, Optional[str]]:
     """Check if ImageMagick is available.
     
@@ -65,6 +71,7 @@ def check_imagemagick() -> Tuple[bool, Optional[str]]:
     return False, None
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> Tuple[bool, Optional[str]]:
     """Check if FFmpeg is available.
     
@@ -74,6 +81,7 @@ def check_ffmpeg() -> Tuple[bool, Optional[str]]:
     return check_command("ffmpeg", version_flag="-version")
 
 
+@lru_cache(maxsize=1)
 def get_imagemagick_command() -> Optional[str]:
     """Get the ImageMagick command to use (magick or convert).
     
@@ -93,3 +101,14 @@ def get_imagemagick_command() -> Optional[str]:
         return "convert"
     
     return None
+
+
+def clear_tool_cache():
+    """Forget memoized tool detection results.
+    
+    The next check re-probes the system, e.g. after installing a tool in a
+    long-running process or when tests change PATH.
+    """
+    check_imagemagick.cache_clear()
+    check_ffmpeg.cache_clear()
+    get_imagemagick_command.cache_clear()
@@ -0,0 +1,127 @@
+"""Persistent on-disk cache for asset metadata."""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+
+class MetaCache:
+    """SQLite-backed metadata cache keyed by (path, mtime, size).
+
+    Entries are invalidated automatically when a file's modification time or
+    size changes. The cache is best-effort: any database error results in a
+    cache miss (or a dropped write), never in a failed operation.
+    """
+
+    CACHE_DIR = Path.home() / ".cache" / "assetguy"
+    CACHE_FILE = CACHE_DIR / "meta.sqlite3"
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """Initialize cache.
+
+        Args:
+            cache_file: Optional path to the SQLite database (default: ~/.cache/assetguy/meta.sqlite3)
+        """
+        self.cache_file = Path(cache_file) if cache_file else self.CACHE_FILE
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use, creating it if needed."""
+        if self._conn is None:
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+                # WAL lets concurrent CLI processes read while another writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta ("
+                    "path TEXT NOT NULL, kind TEXT NOT NULL, "
+                    "mtime INTEGER NOT NULL, size INTEGER NOT NULL, json TEXT NOT NULL, "
+                    "PRIMARY KEY (path, kind))"
+                )
+                self._conn = conn
+            except (sqlite3.Error, OSError):
+                return None
+        return self._conn
+
+    def get(self, path: Union[str, Path], kind: str, st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """Look up cached metadata for a file.
+
+        Args:
+            path: Path to the asset file
+            kind: Metadata kind (e.g. 'gif', 'video')
+            st: Optional stat result for the file (avoids an extra stat call)
+
+        Returns:
+            Cached metadata dictionary, or None on miss
+        """
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT json FROM meta WHERE path = ? AND kind = ? AND mtime = ? AND size = ?",
+                    (os.path.abspath(path), kind, st.st_mtime_ns, st.st_size)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def put(self, path: Union[str, Path], kind: str, info: Dict[str, Any], st: Optional[os.stat_result] = None):
+        """Store metadata for a file.
+
+        Args:
+            path: Path to the asset file
+            kind: Metadata kind (e.g. 'gif', 'video')
+            info: JSON-serializable metadata dictionary
+            st: Optional stat result for the file (avoids an extra stat call)
+        """
+        try:
+            st = st or os.stat(path)
+            data = json.dumps(info)
+        except (OSError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (path, kind, mtime, size, json) VALUES (?, ?, ?, ?, ?)",
+                        (os.path.abspath(path), kind, st.st_mtime_ns, st.st_size, data)
+                    )
+            except sqlite3.Error:
+                pass
+
+
+_meta_cache: Optional[MetaCache] = None
+
+
+def get_meta_cache() -> MetaCache:
+    """Get the process-wide metadata cache.
+
+    Returns:
+        Shared MetaCache instance
+    """
+    global _meta_cache
+    if _meta_cache is None:
+        _meta_cache = MetaCache()
+    return _meta_cache
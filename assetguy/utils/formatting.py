@@ -1,6 +1,14 @@
 """Formatting utilities for file sizes, time, etc."""
 
+import json
 import os
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON serialization
+    orjson = None
 
 
 def format_file_size(size_bytes):
@@ -29,3 +37,24 @@ def filesize_mb(path):
         File size in MB (float)
     """
     return os.path.getsize(path) / (1024 * 1024)
+
+
+def write_json(obj: Any):
+    """Write an object to stdout as indented JSON for CLI output.
+    
+    With orjson the encoded bytes go straight to the binary stdout buffer;
+    otherwise the standard library encoder writes to stdout incrementally.
+    Either way no intermediate str of the whole document is re-encoded.
+    
+    Args:
+        obj: JSON-serializable object
+    """
+    # Text written earlier (e.g. progress messages) must precede the JSON
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if orjson is not None and buffer is not None:
+        buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE, default=str))
+        buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
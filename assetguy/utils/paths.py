@@ -2,7 +2,10 @@
 
 import os
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Sequence, Set, Union
+
+
+_QUOTE_CHARS = frozenset("\"'")
 
 
 def strip_quotes(path: Union[str, Path]) -> str:
@@ -14,9 +17,12 @@ def strip_quotes(path: Union[str, Path]) -> str:
     Returns:
         Path string without quotes
     """
+    # str() and strip() return the same object when there is nothing to do,
+    # so the common unquoted case allocates nothing
     path_str = str(path).strip()
-    if (path_str.startswith('"') and path_str.endswith('"')) or \
-       (path_str.startswith("'") and path_str.endswith("'")):
+    if not path_str or path_str[0] not in _QUOTE_CHARS:
+        return path_str
+    if len(path_str) >= 2 and path_str[-1] == path_str[0]:
         return path_str[1:-1]
     return path_str
 
@@ -37,3 +43,38 @@ def expand_path(path: Union[str, Path, None]) -> Union[Path, None]:
         return None
     expanded = os.path.expanduser(os.path.expandvars(path_str))
     return Path(expanded)
+
+
+def file_sizes(paths: Sequence[Path]) -> List[int]:
+    """Get the sizes of several files.
+    
+    On Windows, os.scandir() entries carry the file size, so each parent
+    directory is listed once instead of stat()ing every file. Elsewhere an
+    entry's size needs a stat call anyway, and each file is stat()ed directly.
+    
+    Args:
+        paths: Paths of existing files
+        
+    Returns:
+        File sizes in bytes, in the same order as paths
+        
+    Raises:
+        FileNotFoundError: If a file does not exist
+    """
+    if os.name != 'nt':
+        return [path.stat().st_size for path in paths]
+    
+    names_by_dir: Dict[Path, Set[str]] = {}
+    for path in paths:
+        names_by_dir.setdefault(path.parent, set()).add(path.name)
+    
+    sizes: Dict[Path, int] = {}
+    for directory, names in names_by_dir.items():
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in names:
+                    sizes[directory / entry.name] = entry.stat().st_size
+    
+    # A name the listing did not match (e.g. a different spelling on a
+    # case-insensitive filesystem) falls back to a plain stat
+    return [sizes[path] if path in sizes else path.stat().st_size for path in paths]
@@ -0,0 +1,28 @@
+"""Interactive prompt helpers."""
+
+from typing import Any, Callable, Optional
+
+import click
+
+
+def ask_optional(label: str, cast: Callable[[str], Any]) -> Optional[Any]:
+    """Prompt for an optional value; an empty answer means "skip".
+    
+    Args:
+        label: Prompt text
+        cast: Conversion applied to a non-empty answer (e.g. int, float, or
+            a click type such as click.IntRange(4, 256); an answer the click
+            type rejects is asked for again)
+        
+    Returns:
+        Converted value, or None if the answer was empty
+    """
+    while True:
+        answer = click.prompt(label, default="", type=str).strip()
+        if not answer:
+            return None
+        try:
+            return cast(answer)
+        except click.BadParameter as e:
+            # Same message format as click.prompt's own validation
+            click.echo(f"Error: {e.message}", err=True)
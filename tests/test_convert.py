@@ -0,0 +1,33 @@
+"""Tests for the video to GIF FFmpeg filter arguments."""
+
+import pytest
+
+from assetguy.operations.convert import gif_filter_args
+
+
+def test_no_filters():
+    assert gif_filter_args() == []
+
+
+def test_fps_and_width_without_colors():
+    assert gif_filter_args(width=320, fps=10) == ["-vf", "fps=10,scale=320:-1"]
+
+
+def test_colors_builds_palette_filter_graph():
+    assert gif_filter_args(width=320, fps=10, colors=64) == [
+        "-filter_complex",
+        "[0:v]fps=10,scale=320:-1,split[s0][s1];"
+        "[s0]palettegen=max_colors=64:stats_mode=diff[p];"
+        "[s1][p]paletteuse=dither=bayer:bayer_scale=5",
+    ]
+
+
+def test_colors_without_other_filters():
+    args = gif_filter_args(colors=4)
+    assert args[1].startswith("[0:v]split[s0][s1];[s0]palettegen=max_colors=4:")
+
+
+@pytest.mark.parametrize("colors", [2, 3, 257])
+def test_colors_outside_palettegen_range_rejected(colors):
+    with pytest.raises(ValueError, match="between 4 and 256"):
+        gif_filter_args(colors=colors)
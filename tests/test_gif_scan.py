@@ -0,0 +1,93 @@
+"""Tests for the GIF block scanner against Pillow's frame metadata."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from assetguy.assets.gif import GifAsset, _scan_gif_blocks
+
+
+def make_gif(frame_count, **save_args):
+    """Encode a small GIF with Pillow, one solid color per frame."""
+    frames = [Image.new('RGB', (4, 3), (i * 60, 255 - i * 60, i * 10)) for i in range(frame_count)]
+    buffer = io.BytesIO()
+    frames[0].save(buffer, 'GIF', save_all=frame_count > 1, append_images=frames[1:], **save_args)
+    return buffer.getvalue()
+
+
+def drop_graphic_control(data, index):
+    """Remove the index-th graphic control extension (21 F9 04 ... 00)."""
+    pos = -1
+    for _ in range(index + 1):
+        pos = data.index(b"\x21\xf9\x04", pos + 1)
+    return data[:pos] + data[pos + 8:]
+
+
+def pillow_frames(data):
+    """Get (width, height, per-frame durations in ms) as Pillow reads them."""
+    with Image.open(io.BytesIO(data)) as img:
+        durations = []
+        for i in range(img.n_frames):
+            img.seek(i)
+            durations.append(img.info.get('duration') or 0)
+        return img.size[0], img.size[1], durations
+
+
+def assert_matches_pillow(data):
+    scanned = _scan_gif_blocks(io.BytesIO(data))
+    assert scanned is not None
+    width, height, delays = scanned
+    assert (width, height, [delay * 10 for delay in delays]) == pillow_frames(data)
+
+
+def test_single_frame_without_graphic_control():
+    data = make_gif(1)
+    assert b"\x21\xf9" not in data
+    assert_matches_pillow(data)
+    assert _scan_gif_blocks(io.BytesIO(data)) == (4, 3, [0])
+
+
+def test_single_frame_with_delay():
+    data = make_gif(1, duration=70)
+    assert_matches_pillow(data)
+    assert _scan_gif_blocks(io.BytesIO(data))[2] == [7]
+
+
+def test_animation_with_netscape_loop_block():
+    data = make_gif(3, duration=[30, 40, 50], loop=0)
+    assert b"NETSCAPE2.0" in data
+    assert_matches_pillow(data)
+    assert _scan_gif_blocks(io.BytesIO(data))[2] == [3, 4, 5]
+
+
+def test_frame_without_graphic_control_has_no_delay():
+    # A graphic control extension only applies to the image that follows it
+    data = drop_graphic_control(make_gif(3, duration=[30, 40, 50], loop=0), 1)
+    assert_matches_pillow(data)
+    assert _scan_gif_blocks(io.BytesIO(data))[2] == [3, 0, 5]
+
+
+def test_truncated_file_is_rejected():
+    data = make_gif(3, duration=[30, 40, 50], loop=0)
+    for length in range(len(data)):
+        assert _scan_gif_blocks(io.BytesIO(data[:length])) is None, length
+
+
+@pytest.mark.parametrize("data", [b"", b"GIF89a", b"\x89PNG\r\n\x1a\n" + b"\x00" * 16])
+def test_non_gif_data_is_rejected(data):
+    assert _scan_gif_blocks(io.BytesIO(data)) is None
+
+
+def test_read_with_pil(tmp_path):
+    path = tmp_path / "anim.gif"
+    path.write_bytes(make_gif(3, duration=[30, 40, 50], loop=0))
+    info = GifAsset._read_with_pil(path)
+    assert info['width'] == 4 and info['height'] == 3
+    assert info['frames'] == 3
+    assert info['delays'] == [3, 4, 5]
+    assert info['duration'] == pytest.approx(0.12)
+
+    # A truncated file is left to the ImageMagick fallback
+    path.write_bytes(path.read_bytes()[:-5])
+    assert GifAsset._read_with_pil(path) is None
@@ -0,0 +1,89 @@
+"""Tests for GifAsset.time_range_to_frames against the original linear scan."""
+
+from fractions import Fraction
+from types import MappingProxyType
+
+import pytest
+
+from assetguy.assets.gif import GifAsset
+
+
+def linear_scan(delays, start_time, end_time):
+    """The original linear scan of time_range_to_frames, in exact arithmetic.
+    
+    Times are taken as the decimal values they are written as (e.g. on the
+    command line), so float accumulation error does not decide ties.
+    """
+    start_time = Fraction(repr(start_time))
+    end_time = Fraction(repr(end_time))
+    
+    cumulative_times = []
+    cumulative = Fraction(0)
+    for delay in delays:
+        cumulative += Fraction(delay, 100)
+        cumulative_times.append(cumulative)
+    
+    # Start frame: first frame that overlaps with start_time
+    start_frame = 0
+    for i, cum_time in enumerate(cumulative_times):
+        if cum_time > start_time:
+            start_frame = i
+            break
+    
+    # End frame: last frame that starts no later than end_time
+    prev_time = Fraction(0)
+    end_frame = len(delays) - 1
+    for i, cum_time in enumerate(cumulative_times):
+        if prev_time > end_time:
+            end_frame = max(0, i - 1)
+            break
+        prev_time = cum_time
+    
+    if start_frame > end_frame:
+        return None
+    return (start_frame, end_frame)
+
+
+def make_asset(tmp_path, delays):
+    """Build a GifAsset whose info is the given delays, without ImageMagick."""
+    path = tmp_path / "anim.gif"
+    path.write_bytes(b"GIF89a")
+    asset = GifAsset(path)
+    asset._info = MappingProxyType({
+        'delays': tuple(delays),
+        'duration': sum(delays) / 100.0,
+    })
+    return asset
+
+
+@pytest.mark.parametrize("delays", [
+    [10] * 10,
+    [7, 3, 0, 12, 5, 0, 0, 8],
+    [33, 33, 34],
+    [0, 10, 10, 0],
+])
+def test_frame_boundaries_match_linear_scan(tmp_path, delays):
+    asset = make_asset(tmp_path, delays)
+    total_cs = sum(delays)
+    
+    # Every frame edge, and points just around it, as decimal seconds
+    times = sorted({
+        round(cs / 100 + offset, 3)
+        for cs in range(total_cs + 1)
+        for offset in (-0.001, 0, 0.001)
+        if 0 <= cs / 100 + offset <= total_cs / 100
+    })
+    
+    for start_time in times:
+        for end_time in times:
+            if start_time >= end_time:
+                continue
+            expected = linear_scan(delays, start_time, end_time)
+            assert asset.time_range_to_frames(start_time, end_time) == expected, (start_time, end_time)
+
+
+def test_float_sums_land_on_frame_edges(tmp_path):
+    asset = make_asset(tmp_path, [10] * 10)
+    # 0.1 + 0.2 is 0.30000000000000004; it still means the edge at 0.3 s
+    assert asset.time_range_to_frames(0.1 + 0.2, 0.6) == (3, 6)
+    assert asset.time_range_to_frames(0.0, None) == (0, 9)